@@ -1,7 +1,9 @@
 """Configuration management for the Docker Web UI application."""
 
+import functools
 import os
 import socket
+import threading
 from pathlib import Path
 from typing import Optional
 from dotenv import load_dotenv
@@ -11,16 +13,32 @@ from pydantic import BaseModel, Field
 load_dotenv()
 
 # Detect if running in Docker Compose environment
+@functools.lru_cache(maxsize=1)
 def is_docker_compose():
-    """Check if running in Docker Compose environment."""
+    """Check if running in Docker Compose environment.
+
+    The result is memoized so the DNS probe runs at most once per process
+    instead of on every re-import or rerun.
+    """
     # Check if running in Docker container
     if os.path.exists('/.dockerenv'):
-        # Try to resolve the 'registry' hostname which would be available in Docker Compose network
-        try:
-            socket.gethostbyname('registry')
-            return True
-        except socket.gaierror:
-            pass
+        # Try to resolve the 'registry' hostname which would be available in
+        # Docker Compose network. setdefaulttimeout does not bound the libc
+        # resolver, so run the lookup in a daemon thread and give up after
+        # half a second; a slow resolver then can't stall startup
+        resolved = []
+
+        def _probe():
+            try:
+                socket.gethostbyname('registry')
+                resolved.append(True)
+            except socket.gaierror:
+                pass
+
+        probe = threading.Thread(target=_probe, daemon=True)
+        probe.start()
+        probe.join(timeout=0.5)
+        return bool(resolved)
     return False
 
 # Adjust registry URL if running in Docker Compose
@@ -31,18 +49,16 @@ class GitConfig(BaseModel):
     username: str = Field(default_factory=lambda: os.getenv("GIT_USERNAME", ""))
     email: str = Field(default_factory=lambda: os.getenv("GIT_EMAIL", ""))
     token: Optional[str] = Field(default_factory=lambda: os.getenv("GIT_TOKEN", None))
+    shallow: bool = Field(
+        default_factory=lambda: os.getenv("GIT_SHALLOW", "true").lower() in ("1", "true", "yes")
+    )
 
 class RegistryConfig(BaseModel):
     """Docker registry configuration settings."""
     url: str = Field(default_factory=lambda: os.getenv("REGISTRY_URL", DEFAULT_REGISTRY_URL))
     username: Optional[str] = Field(default_factory=lambda: os.getenv("REGISTRY_USERNAME", None))
     password: Optional[str] = Field(default_factory=lambda: os.getenv("REGISTRY_PASSWORD", None))
-    
-    def __init__(self, **data):
-        super().__init__(**data)
-        # This will be updated by app_state.py when loading from storage
-        self.url = os.getenv("REGISTRY_URL", DEFAULT_REGISTRY_URL)
-        
+
 class AppConfig(BaseModel):
     """Application configuration settings."""
     temp_dir: Path = Field(
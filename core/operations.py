@@ -2,17 +2,29 @@
 Core operations for the Docker Web UI application.
 """
 
+import re
+import hashlib
+import functools
+from collections import deque
 import streamlit as st
 from typing import Optional, Dict, Any, Tuple
 
-from modules import GitHandler
+from ui.app_state import set_dockerfile_content, _BUILD_LOG_LINES
 from utils import validate_dockerfile_content, validate_build_args
 from utils.formatters import format_build_log, format_registry_url
 from config import config
 
+# KEY=VALUE lines in a build-args block (comments and blanks are skipped)
+_BUILD_ARG_RE = re.compile(r'^\s*([^#=\s][^=]*?)\s*=\s*(.*?)\s*$', re.MULTILINE)
+
+# Non-blank, non-comment lines that are not valid KEY=VALUE pairs
+_BAD_ARG_LINE_RE = re.compile(r'^[ \t]*(=[^\n]*|[^#=\s][^=\n]*)[ \t]*$', re.MULTILINE)
+
 
 def clone_repository(repo_url: str, branch: str) -> bool:
     try:
+        from modules import GitHandler
+
         st.session_state.git_handler = GitHandler(repo_url, branch)
         
         # Add progress container
@@ -49,31 +61,62 @@ def clone_repository(repo_url: str, branch: str) -> bool:
         return False
 
 
+@st.cache_data(ttl=300, show_spinner=False)
+def _read_dockerfile_cached(repo_path: str, dockerfile_rel_path: str, head_sha: str) -> str:
+    """Read a Dockerfile, cached per (repo, path, HEAD commit).
+
+    Keying on the HEAD SHA means reruns hit memory until the repository
+    actually changes; uncommitted saves clear the cache explicitly.
+    """
+    from pathlib import Path
+    return Path(repo_path, dockerfile_rel_path).read_text(encoding="utf-8")
+
+
+def _read_dockerfile(git_handler, dockerfile_rel_path) -> Tuple[bool, str]:
+    """Read a Dockerfile through the HEAD-keyed cache when possible."""
+    if git_handler.repo is not None:
+        try:
+            head_sha = git_handler.repo.head.commit.hexsha
+            return True, _read_dockerfile_cached(
+                str(git_handler.repo_path), dockerfile_rel_path, head_sha
+            )
+        except Exception:
+            # Missing file, detached repo state, etc. — use the direct path
+            pass
+    return git_handler.read_dockerfile(dockerfile_rel_path)
+
+
 def load_dockerfile(silent: bool = False) -> bool:
 
-    if not st.session_state.git_handler:
+    # Bind session state and the handler locally; attribute lookups add up
+    # on this rerun-hot path
+    ss = st.session_state
+    gh = ss.git_handler
+    if not gh:
         if not silent:
             st.error("Git repository not initialized")
         return False
-    
+
     try:
         # Try to load the default Dockerfile first
-        success, content = st.session_state.git_handler.read_dockerfile(st.session_state.dockerfile_path)
+        success, content = _read_dockerfile(gh, ss.dockerfile_path)
         
         if success:
-            st.session_state.dockerfile_content = content
+            set_dockerfile_content(content)
             return True
         else:
-            # If the default Dockerfile is not found, try to find any Dockerfile
-            dockerfile_paths = st.session_state.git_handler.list_dockerfile_paths()
-            
+            # If the default Dockerfile is not found, try to find any Dockerfile.
+            # Reuse the list discovered at clone time when available instead of
+            # re-walking the repository
+            dockerfile_paths = ss.available_dockerfiles or gh.list_dockerfile_paths()
+
             if dockerfile_paths:
                 # Use the first available Dockerfile
-                st.session_state.dockerfile_path = dockerfile_paths[0]
-                success, content = st.session_state.git_handler.read_dockerfile(st.session_state.dockerfile_path)
+                ss.dockerfile_path = dockerfile_paths[0]
+                success, content = _read_dockerfile(gh, ss.dockerfile_path)
                 
                 if success:
-                    st.session_state.dockerfile_content = content
+                    set_dockerfile_content(content)
                     return True
             
             # If we still don't have a Dockerfile, show an error
@@ -86,26 +129,42 @@ def load_dockerfile(silent: bool = False) -> bool:
         return False
 
 
+@functools.lru_cache(maxsize=32)
+def _validate_dockerfile_cached(content_hash: str, content: str) -> Tuple[bool, str]:
+    """Memoized Dockerfile validation keyed by content hash.
+
+    Repeated saves of unchanged content (or rerun-triggered callbacks)
+    return the cached verdict instead of re-scanning the file. Plain
+    lru_cache rather than st.cache_data so it also works outside a
+    Streamlit script context.
+    """
+    return validate_dockerfile_content(content)
+
+
 def save_dockerfile(content: str) -> bool:
 
-    if not st.session_state.git_handler:
+    ss = st.session_state
+    gh = ss.git_handler
+    if not gh:
         st.error("Git repository not initialized")
         return False
-    
+
     try:
         # Validate Dockerfile content
-        is_valid, error_message = validate_dockerfile_content(content)
+        content_hash = hashlib.blake2b(content.encode(), digest_size=16).hexdigest()
+        is_valid, error_message = _validate_dockerfile_cached(content_hash, content)
         if not is_valid:
             st.error(error_message)
             return False
         
         # Save the content
-        success, message = st.session_state.git_handler.write_dockerfile(
-            content, st.session_state.dockerfile_path
-        )
+        success, message = gh.write_dockerfile(content, ss.dockerfile_path)
         
         if success:
-            st.session_state.dockerfile_content = content
+            set_dockerfile_content(content)
+            # The file changed without a new HEAD commit, so the HEAD-keyed
+            # read cache is stale until cleared
+            _read_dockerfile_cached.clear()
             st.success(message)
             return True
         else:
@@ -117,35 +176,55 @@ def save_dockerfile(content: str) -> bool:
 
 
 def build_docker_image(repository: str, tag: str, build_args: Optional[Dict[str, str]] = None) -> bool:
-    if not st.session_state.git_handler:
+    ss = st.session_state
+    gh = ss.git_handler
+    if not gh:
         st.error("Git repository not initialized")
         return False
-    
+
     try:
         # Get the Dockerfile path
-        dockerfile_path = st.session_state.git_handler.get_dockerfile_path(st.session_state.dockerfile_path)
+        dockerfile_path = gh.get_dockerfile_path(ss.dockerfile_path)
         
         # Build the image
         full_tag = f"{repository}:{tag}"
-        
+
+        # Stream build output to the UI while keeping the full log for the Logs tab
+        log_placeholder = st.empty()
+        streamed_lines = []
+
+        def stream_line(line: str):
+            streamed_lines.append(line)
+            # Refresh the preview periodically rather than per line to keep
+            # the frontend responsive during chatty builds
+            if len(streamed_lines) % 25 == 0:
+                log_placeholder.code("\n".join(streamed_lines[-30:]), language="text")
+
         with st.spinner(f"Building Docker image {full_tag}..."):
-            success, logs, image_id = st.session_state.docker_handler.build_image(
+            success, logs, image_id = ss.docker_handler.build_image(
                 dockerfile_path=dockerfile_path,
                 tag=full_tag,
-                build_args=build_args
+                build_args=build_args,
+                line_callback=stream_line
             )
-        
-        # Store build logs
-        st.session_state.build_logs = format_build_log(logs)
-        
+
+        log_placeholder.empty()
+
+        # Store build logs as a bounded line buffer
+        if streamed_lines:
+            formatted = format_build_log("\n".join(streamed_lines))
+        else:
+            formatted = format_build_log(logs)
+        ss.build_logs = deque(formatted.splitlines(), maxlen=_BUILD_LOG_LINES)
+
         if success:
-            st.session_state.build_success = True
-            st.session_state.image_id = image_id
+            ss.build_success = True
+            ss.image_id = image_id
             st.success(f"Successfully built Docker image: {full_tag}")
             return True
         else:
-            st.session_state.build_success = False
-            st.session_state.image_id = None
+            ss.build_success = False
+            ss.image_id = None
             st.error("Build failed. Check the logs for details.")
             return False
     except Exception as e:
@@ -163,11 +242,7 @@ def push_to_registry(repository: str, tag: str) -> bool:
     registry_url = config.registry.url
     
     # Clean registry URL for proper tagging
-    clean_registry_url = registry_url
-    if clean_registry_url.startswith(('http://', 'https://')):
-        clean_registry_url = clean_registry_url.split('://', 1)[1]
-    if clean_registry_url.endswith('/'):
-        clean_registry_url = clean_registry_url[:-1]
+    clean_registry_url = registry_url.removeprefix('https://').removeprefix('http://').rstrip('/')
     
     try:
         # Create full tag with registry URL
@@ -180,9 +255,18 @@ def push_to_registry(repository: str, tag: str) -> bool:
             if not tag_success:
                 st.error(f"Failed to tag image: {tag_message}")
                 return False
-            
-            # Then push the image to the registry
-            success, message = st.session_state.docker_handler.push_image(full_tag)
+
+            # Then push the image to the registry, surfacing progress lines
+            # while the transfer is still running
+            push_placeholder = st.empty()
+
+            def stream_push_line(line: str):
+                push_placeholder.text(line)
+
+            success, message = st.session_state.docker_handler.push_image(
+                full_tag, line_callback=stream_push_line
+            )
+            push_placeholder.empty()
         
         if success:
             st.success(f"Successfully pushed image to registry: {format_registry_url(registry_url, repository, tag)}")
@@ -233,17 +317,14 @@ def parse_build_args(build_args_text: str) -> Tuple[bool, Dict[str, str], str]:
         return True, {}, ""
     
     try:
-        for line in build_args_text.strip().split("\n"):
-            line = line.strip()
-            if not line or line.startswith("#"):
-                continue
-            
-            if "=" not in line:
-                return False, {}, f"Invalid build argument format: {line}. Expected format: KEY=VALUE"
-            
-            key, value = line.split("=", 1)
-            build_args[key.strip()] = value.strip()
-        
+        # Report the first malformed line, then extract all KEY=VALUE pairs
+        # in a single pass of the regex engine instead of a per-line loop
+        bad_line = _BAD_ARG_LINE_RE.search(build_args_text)
+        if bad_line:
+            return False, {}, f"Invalid build argument format: {bad_line.group(1).strip()}. Expected format: KEY=VALUE"
+
+        build_args = dict(_BUILD_ARG_RE.findall(build_args_text))
+
         # Validate build args
         is_valid, error_message, validated_args = validate_build_args(build_args)
         if not is_valid:
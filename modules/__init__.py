@@ -1,7 +1,23 @@
 """Docker Web UI modules package."""
 
-from .git_handler import GitHandler
-from .registry_handler import RegistryHandler
-from .file_handler import FileHandler
+import importlib
+
+# Handlers are imported lazily (PEP 562) so importing the package does not
+# pull in GitPython or requests until a handler is actually used
+_LAZY = {
+    'GitHandler': '.git_handler',
+    'RegistryHandler': '.registry_handler',
+    'FileHandler': '.file_handler',
+}
 
 __all__ = ['GitHandler', 'RegistryHandler', 'FileHandler']
+
+
+def __getattr__(name):
+    try:
+        module = importlib.import_module(_LAZY[name], __name__)
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(module, name)
+    globals()[name] = value  # cache so the import runs at most once
+    return value
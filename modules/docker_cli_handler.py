@@ -1,13 +1,65 @@
 """Docker operations module using CLI commands instead of SDK."""
 
 import os
+import re
 import json
+import socket
+import datetime
+import http.client
 import subprocess
+import threading
+from collections import deque
 from pathlib import Path
-from typing import Optional, Tuple, List, Dict, Any, Iterator, Union
+from typing import Callable, Optional, Tuple, List, Dict, Any, Iterator, Union
+from urllib.parse import quote
 
 from config import config
 
+# Default location of the Docker daemon's Unix socket
+_DOCKER_SOCKET = "/var/run/docker.sock"
+
+# Matches the image ID line emitted by the legacy docker builder
+_IMAGE_ID_RE = re.compile(r"^Successfully built ([0-9a-f]{12,})")
+
+# Matches the image digest line emitted by the BuildKit builder
+_BUILDKIT_IMAGE_RE = re.compile(r"writing image (sha256:[0-9a-f]+)")
+
+# Number of trailing log lines retained from a build
+_BUILD_LOG_TAIL = 5000
+
+# Decimal units as used by `docker images` for the SIZE column
+_SIZE_UNITS = ("B", "kB", "MB", "GB", "TB", "PB")
+
+
+def _human_size(size_bytes: Union[int, float]) -> str:
+    """Render a byte count the way the docker CLI does (e.g. '72.8MB')."""
+    size = float(size_bytes)
+    unit = 0
+    while size >= 1000 and unit < len(_SIZE_UNITS) - 1:
+        size /= 1000
+        unit += 1
+    return f"{size:.4g}{_SIZE_UNITS[unit]}"
+
+
+def _cli_timestamp(epoch: Union[int, float]) -> str:
+    """Render a Unix timestamp in the docker CLI's CREATED AT format."""
+    dt = datetime.datetime.fromtimestamp(epoch, datetime.timezone.utc)
+    return dt.strftime("%Y-%m-%d %H:%M:%S +0000 UTC")
+
+
+class _UnixHTTPConnection(http.client.HTTPConnection):
+    """HTTP connection to the Docker Engine API over its Unix socket."""
+
+    def __init__(self, socket_path: str = _DOCKER_SOCKET, timeout: float = 10):
+        super().__init__("localhost", timeout=timeout)
+        self.socket_path = socket_path
+
+    def connect(self):
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        sock.settimeout(self.timeout)
+        sock.connect(self.socket_path)
+        self.sock = sock
+
 
 class DockerCLIHandler:
     """Handles Docker image operations using CLI commands."""
@@ -16,33 +68,82 @@ class DockerCLIHandler:
         """Initialize the DockerCLIHandler."""
         # Check if Docker CLI is available
         try:
+            # Ask for just the server version scalar instead of the full
+            # multi-KB version JSON blob that we'd only read one field from
             result = subprocess.run(
-                ["docker", "version", "--format", "{{json .}}"],
+                ["docker", "version", "--format", "{{.Server.Version}}"],
                 capture_output=True,
                 text=True,
-                check=True
+                check=True,
+                close_fds=False
             )
-            self.docker_info = json.loads(result.stdout)
+            server_version = result.stdout.strip()
+            self.docker_info = {"Server": {"Version": server_version}}
             print(f"Successfully connected to Docker daemon using CLI")
-            print(f"Docker version: {self.docker_info.get('Server', {}).get('Version', 'unknown')}")
+            print(f"Docker version: {server_version or 'unknown'}")
         except subprocess.CalledProcessError as e:
             raise RuntimeError(f"Failed to initialize Docker client: {str(e)}")
-        except json.JSONDecodeError as e:
-            raise RuntimeError(f"Failed to parse Docker version: {str(e)}")
+
+        # Build through BuildKit unless explicitly disabled; BuildKit reuses
+        # layer caches across rebuilds and runs multi-stage builds concurrently
+        self.use_buildkit = os.getenv("DOCKER_WEBUI_BUILDKIT", "1").lower() not in ("0", "false", "no")
+
+        # Persistent Engine API connection, created lazily on first use.
+        # Talking to the daemon directly skips a docker CLI fork/exec per call.
+        # The handler is shared process-wide (st.cache_resource), so the
+        # lock keeps concurrent script runs from interleaving request/
+        # response pairs on the single http.client connection.
+        self._api: Optional[_UnixHTTPConnection] = None
+        self._api_lock = threading.Lock()
+
+    def _api_request(self, method: str, path: str) -> Tuple[int, bytes]:
+        """
+        Send a request to the Docker Engine API over the Unix socket.
+
+        The connection is created once and reused across calls. Raises
+        OSError (or http.client.HTTPException) when the socket is
+        unavailable, so callers can fall back to the CLI.
+
+        Args:
+            method: HTTP method
+            path: Engine API path (including query string)
+
+        Returns:
+            Tuple of (status code, response body)
+        """
+        with self._api_lock:
+            if self._api is None:
+                self._api = _UnixHTTPConnection()
+
+            try:
+                self._api.request(method, path)
+                response = self._api.getresponse()
+                return response.status, response.read()
+            except (http.client.HTTPException, OSError):
+                # Drop the broken connection so the next call reconnects
+                self._api.close()
+                self._api = None
+                raise
 
     def build_image(
-        self, 
-        dockerfile_path: Path, 
-        tag: str, 
-        build_args: Optional[Dict[str, str]] = None
+        self,
+        dockerfile_path: Path,
+        tag: str,
+        build_args: Optional[Dict[str, str]] = None,
+        line_callback: Optional[Callable[[str], None]] = None
     ) -> Tuple[bool, str, Optional[str]]:
         """
         Build a Docker image from a Dockerfile.
 
+        The build output is streamed line by line instead of being buffered
+        whole, so memory stays flat for long builds and callers can surface
+        progress while the build is running.
+
         Args:
             dockerfile_path: Path to the Dockerfile
             tag: Tag for the image
             build_args: Build arguments
+            line_callback: Optional callback invoked with each output line
 
         Returns:
             Tuple of (success, message, image_id)
@@ -50,45 +151,85 @@ class DockerCLIHandler:
         try:
             # Prepare build command
             cmd = ["docker", "build", "-f", str(dockerfile_path), "-t", tag]
-            
+
             # Add build args if provided
             if build_args:
                 for key, value in build_args.items():
                     cmd.extend(["--build-arg", f"{key}={value}"])
-            
+
+            env = os.environ.copy()
+            if self.use_buildkit:
+                env["DOCKER_BUILDKIT"] = "1"
+                # Embed cache metadata in the image so later builds can reuse
+                # its layers via --cache-from
+                cmd.extend(["--build-arg", "BUILDKIT_INLINE_CACHE=1"])
+
             # Add context directory
             cmd.append(str(dockerfile_path.parent))
-            
-            # Run the build command
-            process = subprocess.run(
+
+            # Stream the build output, keeping only a bounded tail in memory
+            process = subprocess.Popen(
                 cmd,
-                capture_output=True,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.STDOUT,
                 text=True,
-                check=False
+                bufsize=1,
+                env=env,
+                close_fds=False
             )
-            
-            if process.returncode == 0:
-                # Extract image ID from the output
-                for line in process.stdout.splitlines():
-                    if "Successfully built" in line:
-                        image_id = line.split()[-1]
-                        return True, f"Successfully built image: {tag}", image_id
-                
-                return True, f"Successfully built image: {tag}", None
+
+            log_tail = deque(maxlen=_BUILD_LOG_TAIL)
+            image_id = None
+            for line in process.stdout:
+                line = line.rstrip("\n")
+                log_tail.append(line)
+
+                match = _IMAGE_ID_RE.match(line) or _BUILDKIT_IMAGE_RE.search(line)
+                if match:
+                    image_id = match.group(1)
+
+                if line_callback:
+                    line_callback(line)
+
+            if process.wait() == 0:
+                return True, f"Successfully built image: {tag}", image_id
             else:
-                return False, f"Failed to build image: {process.stderr}", None
+                return False, f"Failed to build image:\n" + "\n".join(log_tail), None
         except Exception as e:
             return False, f"Error building image: {str(e)}", None
 
     def tag_image(self, source_tag: str, target_tag: str) -> Tuple[bool, str]:
+        # Prefer the Engine API over the reusable socket; fall back to the CLI
+        # if the socket is unavailable (e.g. remote daemon via DOCKER_HOST)
+        try:
+            # A colon only separates the tag when it follows the last '/';
+            # otherwise it belongs to a registry port (localhost:5000/repo)
+            repo, sep, tag = target_tag.rpartition(":")
+            if not sep or "/" in tag:
+                repo, tag = target_tag, "latest"
+
+            status, body = self._api_request(
+                "POST",
+                f"/images/{quote(source_tag, safe='')}/tag"
+                f"?repo={quote(repo, safe='')}&tag={quote(tag, safe='')}"
+            )
+
+            if status == 201:
+                return True, f"Successfully tagged {source_tag} as {target_tag}"
+            else:
+                return False, f"Failed to tag image: {body.decode(errors='replace')}"
+        except (http.client.HTTPException, OSError):
+            pass
+
         try:
             process = subprocess.run(
                 ["docker", "tag", source_tag, target_tag],
                 capture_output=True,
                 text=True,
-                check=False
+                check=False,
+                close_fds=False
             )
-            
+
             if process.returncode == 0:
                 return True, f"Successfully tagged {source_tag} as {target_tag}"
             else:
@@ -96,7 +237,12 @@ class DockerCLIHandler:
         except Exception as e:
             return False, f"Error tagging image: {str(e)}"
 
-    def push_image(self, repository_or_full_tag: str, tag: str = None) -> Tuple[bool, str]:
+    def push_image(
+        self,
+        repository_or_full_tag: str,
+        tag: str = None,
+        line_callback: Optional[Callable[[str], None]] = None
+    ) -> Tuple[bool, str]:
         try:
             # If tag is None, assume repository_or_full_tag is a full tag
             # Otherwise, construct the full tag from repository and tag
@@ -104,36 +250,73 @@ class DockerCLIHandler:
                 full_tag = repository_or_full_tag
             else:
                 full_tag = f"{repository_or_full_tag}:{tag}"
-                
-            process = subprocess.run(
+
+            # Stream push progress line by line (pushes can run for minutes)
+            # instead of blocking until the whole transfer completes
+            process = subprocess.Popen(
                 ["docker", "push", full_tag],
-                capture_output=True,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.STDOUT,
                 text=True,
-                check=False
+                bufsize=1,
+                close_fds=False
             )
-            
-            if process.returncode == 0:
+
+            log_tail = deque(maxlen=_BUILD_LOG_TAIL)
+            for line in process.stdout:
+                line = line.rstrip("\n")
+                log_tail.append(line)
+                if line_callback:
+                    line_callback(line)
+
+            if process.wait() == 0:
                 return True, f"Successfully pushed image: {full_tag}"
             else:
-                return False, f"Failed to push image: {process.stderr}"
+                return False, f"Failed to push image:\n" + "\n".join(log_tail)
         except Exception as e:
             return False, f"Error pushing image: {str(e)}"
 
     def list_images(self) -> Tuple[bool, List[Dict[str, Any]], str]:
+        # Prefer the Engine API over the reusable socket; the response is
+        # mapped to the CLI's field names and value formats so callers see
+        # the same shape regardless of which path served the listing
+        try:
+            status, body = self._api_request("GET", "/images/json")
+            if status == 200:
+                images = []
+                for entry in json.loads(body):
+                    image_id = entry.get("Id", "").removeprefix("sha256:")[:12]
+                    created_at = _cli_timestamp(entry.get("Created", 0))
+                    size = _human_size(entry.get("Size", 0))
+                    for repo_tag in entry.get("RepoTags") or ["<none>:<none>"]:
+                        repo, _, tag = repo_tag.rpartition(":")
+                        images.append({
+                            "Repository": repo,
+                            "Tag": tag,
+                            "ID": image_id,
+                            "CreatedAt": created_at,
+                            "Size": size
+                        })
+
+                return True, images, f"Found {len(images)} images"
+        except (http.client.HTTPException, OSError, json.JSONDecodeError):
+            pass
+
         try:
             process = subprocess.run(
                 ["docker", "images", "--format", "{{json .}}"],
                 capture_output=True,
                 text=True,
-                check=False
+                check=False,
+                close_fds=False
             )
             
             if process.returncode == 0:
-                images = []
-                for line in process.stdout.splitlines():
-                    if line.strip():
-                        images.append(json.loads(line))
-                
+                # Bind json.loads locally so the per-line parse loop skips the
+                # module attribute lookup on hosts with thousands of images
+                loads = json.loads
+                images = [loads(line) for line in process.stdout.splitlines() if line.strip()]
+
                 return True, images, f"Found {len(images)} images"
             else:
                 return False, [], f"Failed to list images: {process.stderr}"
@@ -141,9 +324,6 @@ class DockerCLIHandler:
             return False, [], f"Error listing images: {str(e)}"
 
     def get_build_logs(self, build_output: str) -> List[Dict[str, Any]]:
-        logs = []
-        for line in build_output.splitlines():
-            if line.strip():
-                logs.append({"stream": line})
-        
-        return logs
+        # Single comprehension keeps the loop in C-level bytecode instead of
+        # per-line append dispatch
+        return [{"stream": line} for line in build_output.splitlines() if line.strip()]
@@ -1,13 +1,35 @@
 """Git operations module for cloning, committing, and pushing Dockerfiles."""
 
 import os
+import hashlib
 from pathlib import Path
-from typing import Optional, Tuple, List
-import git
-from git import Repo, GitCommandError
+from typing import Optional, Tuple, List, TYPE_CHECKING
 
 from config import config
 
+if TYPE_CHECKING:
+    from git import Repo
+
+# GitPython module, imported on first use; pulling it in at module import
+# time costs ~100 ms of Streamlit cold-start even for sessions that never
+# touch a repository
+_git = None
+
+
+def _load_git():
+    """Import GitPython once, on the first operation that needs it."""
+    global _git
+    if _git is None:
+        import git as _git
+    return _git
+
+# Directories skipped by the filesystem Dockerfile scan; they never hold
+# Dockerfiles of interest but can contain tens of thousands of files
+_SCAN_SKIP_DIRS = frozenset({'.git', 'node_modules', '__pycache__', '.venv', 'vendor', 'dist', 'build'})
+
+# Filename suffixes recognized as Dockerfiles (besides the exact name)
+_DOCKERFILE_SUFFIXES = (".dockerfile", ".Dockerfile")
+
 
 class GitHandler:
     """Handles Git repository operations."""
@@ -24,7 +46,25 @@ class GitHandler:
         self.branch = branch
         self.repo_name = self._extract_repo_name(repo_url)
         self.repo_path = config.app.temp_dir / self.repo_name
-        self.repo: Optional[Repo] = None
+        self.repo: Optional["Repo"] = None
+        # Clone URL with the auth token applied, computed once
+        if config.git.token:
+            self._authed_url = repo_url.replace("https://", f"https://{config.git.token}@", 1)
+        else:
+            self._authed_url = repo_url
+        # Cached Dockerfile scan; invalidated when the working tree changes
+        self._dockerfile_paths: Optional[List[str]] = None
+        # Metadata caches keyed on the HEAD SHA so rerun-driven lookups
+        # skip object walks until the repository actually moves
+        self._commit_info_cache: Optional[Tuple[str, dict]] = None
+        self._branch_info_cache: Optional[Tuple[str, dict]] = None
+        # Whether the configured git identity has been verified for this repo
+        self._identity_ensured = False
+
+    def _invalidate_info_caches(self):
+        """Drop the HEAD-keyed metadata caches after the repo moves."""
+        self._commit_info_cache = None
+        self._branch_info_cache = None
 
     @staticmethod
     def _extract_repo_name(repo_url: str) -> str:
@@ -64,6 +104,86 @@ class GitHandler:
             
         return progress_handler
 
+    def _mirror_path(self) -> Path:
+        """Get the path of the cached bare mirror for this repository URL."""
+        url_hash = hashlib.sha1(self.repo_url.encode()).hexdigest()[:16]
+        return config.app.temp_dir / ".mirrors" / url_hash
+
+    def _clone_from_mirror(self, url: str, progress_callback: Optional[callable] = None) -> bool:
+        """
+        Create the working tree from a cached bare mirror.
+
+        The mirror is cloned once per URL and only fetched afterwards, so
+        switching back to a previously used repository skips the network
+        transfer entirely and just materializes a worktree.
+
+        Args:
+            url: Clone URL (with auth token applied if configured)
+            progress_callback: Callback function to report progress
+
+        Returns:
+            True if the working tree was created, False to fall back to a
+            direct clone
+        """
+        try:
+            git = _load_git()
+            mirror = self._mirror_path()
+            if mirror.exists():
+                if progress_callback:
+                    progress_callback(0, 100, "Updating cached mirror")
+                # Repair caches created by earlier --mirror clones: worktrees
+                # share the cache's config, and remote.origin.mirror makes
+                # every push with a refspec fail from them
+                with git.Repo(mirror).config_writer() as cw:
+                    if cw.has_option('remote "origin"', 'mirror'):
+                        cw.remove_option('remote "origin"', 'mirror')
+                    cw.set_value('remote "origin"', 'fetch',
+                                 '+refs/heads/*:refs/remotes/origin/*')
+                cache_git = git.Git(str(mirror))
+                # Drop registrations whose directories are gone (nothing
+                # else ever prunes them); a stale one would block the
+                # worktree add below
+                cache_git.worktree("prune")
+                # The refspec set above fetches into refs/remotes/*, so the
+                # refresh can't be refused for branches checked out in
+                # still-live worktrees the way fetching local heads was
+                cache_git.fetch("origin", "--prune")
+                # Base the worktree on the just-fetched remote-tracking ref,
+                # resetting the local branch to it; the plain local head is
+                # stale now that fetches no longer rewrite it
+                cache_git.worktree(
+                    "add", "--force", "-B", self.branch,
+                    str(self.repo_path), f"origin/{self.branch}"
+                )
+            else:
+                if progress_callback:
+                    progress_callback(0, 100, "Creating repository mirror")
+                mirror.parent.mkdir(parents=True, exist_ok=True)
+                # A plain bare clone, not --mirror: the mirror flag would be
+                # inherited by every worktree and break their pushes
+                cache = git.Repo.clone_from(
+                    url,
+                    mirror,
+                    bare=True,
+                    progress=self._create_progress_handler(progress_callback)
+                )
+                # Bare clones carry no fetch refspec; set the standard
+                # remote-tracking one so later refreshes can fetch
+                with cache.config_writer() as cw:
+                    cw.set_value('remote "origin"', 'fetch',
+                                 '+refs/heads/*:refs/remotes/origin/*')
+                # A fresh bare clone's local heads are current, so the
+                # worktree can check the branch out directly
+                git.Git(str(mirror)).worktree(
+                    "add", "--force", str(self.repo_path), self.branch
+                )
+
+            self.repo = git.Repo(self.repo_path)
+            return True
+        except Exception:
+            # Any mirror/worktree failure falls back to a plain clone
+            return False
+
     def clone(self, progress_callback: Optional[callable] = None) -> Tuple[bool, str]:
         """
         Clone the repository.
@@ -75,10 +195,15 @@ class GitHandler:
         Returns:
             Tuple of (success, message)
         """
+        git = _load_git()
         try:
+            # The working tree is about to change; drop the caches
+            self._dockerfile_paths = None
+            self._invalidate_info_caches()
+
             if self.repo_path.exists():
                 # Repository already exists, pull latest changes
-                self.repo = Repo(self.repo_path)
+                self.repo = git.Repo(self.repo_path)
                 origin = self.repo.remotes.origin
                 
                 if progress_callback:
@@ -90,33 +215,64 @@ class GitHandler:
                 # Clone the repository
                 if progress_callback:
                     progress_callback(0, 100, "Starting clone")
-                
-                if config.git.token:
-                    # Use token for authentication if provided
-                    auth_url = self.repo_url.replace("https://", f"https://{config.git.token}@")
-                    self.repo = Repo.clone_from(
-                        auth_url, 
-                        self.repo_path, 
-                        branch=self.branch,
-                        progress=self._create_progress_handler(progress_callback)
-                    )
-                else:
-                    self.repo = Repo.clone_from(
-                        self.repo_url, 
-                        self.repo_path, 
+
+                # Use the token-authenticated URL precomputed in __init__
+                clone_url = self._authed_url
+
+                # Prefer the cached bare mirror so re-cloning a previously
+                # used repository skips the network transfer
+                if not self._clone_from_mirror(clone_url, progress_callback):
+                    clone_kwargs = {}
+                    if config.git.shallow:
+                        # The UI only reads the latest tree, so history and
+                        # tags are wasted transfer; fetch a single commit of
+                        # the one branch we check out
+                        clone_kwargs = {"depth": 1, "single_branch": True, "no_tags": True}
+
+                    self.repo = git.Repo.clone_from(
+                        clone_url,
+                        self.repo_path,
                         branch=self.branch,
-                        progress=self._create_progress_handler(progress_callback)
+                        progress=self._create_progress_handler(progress_callback),
+                        **clone_kwargs
                     )
-                
+
                 if progress_callback:
                     progress_callback(100, 100, "Clone complete")
-                
+
                 return True, f"Successfully cloned repository to {self.repo_path}"
-        except GitCommandError as e:
+        except git.GitCommandError as e:
             return False, f"Git error: {str(e)}"
         except Exception as e:
             return False, f"Error cloning repository: {str(e)}"
 
+    @classmethod
+    def clone_many(cls, entries: List[Tuple[str, str]], max_workers: int = 4) -> List[Tuple[bool, str]]:
+        """
+        Clone several repositories in parallel.
+
+        Clones are network-latency-bound rather than client-bound, so a
+        small thread pool finishes N clones in roughly the time of the
+        slowest one instead of their sum.
+
+        Args:
+            entries: List of (repo_url, branch) tuples
+            max_workers: Maximum number of concurrent clones (default: 4)
+
+        Returns:
+            List of (success, message) tuples, in the same order as entries
+        """
+        from concurrent.futures import ThreadPoolExecutor
+
+        os.makedirs(config.app.temp_dir, exist_ok=True)
+
+        def _clone_one(entry: Tuple[str, str]) -> Tuple[bool, str]:
+            url, branch = entry
+            return cls(url, branch).clone()
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(_clone_one, entries))
+
     def get_dockerfile_path(self, dockerfile_path: Optional[str] = None) -> Path:
         """
         Get the path to the Dockerfile.
@@ -141,14 +297,13 @@ class GitHandler:
         Returns:
             Tuple of (success, content or error message)
         """
+        file_path = self.get_dockerfile_path(dockerfile_path)
         try:
-            file_path = self.get_dockerfile_path(dockerfile_path)
-            if not file_path.exists():
-                return False, f"Dockerfile not found at {file_path}"
-            
-            with open(file_path, "r") as f:
-                content = f.read()
-            return True, content
+            # Single read(2) plus a C-level decode; attempting the read
+            # directly also drops the separate exists() stat call
+            return True, file_path.read_bytes().decode("utf-8")
+        except FileNotFoundError:
+            return False, f"Dockerfile not found at {file_path}"
         except Exception as e:
             return False, f"Error reading Dockerfile: {str(e)}"
 
@@ -165,8 +320,7 @@ class GitHandler:
         """
         try:
             file_path = self.get_dockerfile_path(dockerfile_path)
-            with open(file_path, "w") as f:
-                f.write(content)
+            file_path.write_bytes(content.encode("utf-8"))
             return True, f"Successfully updated Dockerfile at {file_path}"
         except Exception as e:
             return False, f"Error writing to Dockerfile: {str(e)}"
@@ -182,34 +336,60 @@ class GitHandler:
         Returns:
             Tuple of (success, message)
         """
+        git = _load_git()
         try:
             if self.repo is None:
                 return False, "Repository not initialized"
-            
-            # Configure Git user if provided
-            if config.git.username and config.git.email:
-                self.repo.config_writer().set_value("user", "name", config.git.username).release()
-                self.repo.config_writer().set_value("user", "email", config.git.email).release()
-            
+
+            # Configure Git user if provided (once per handler)
+            self._ensure_git_identity()
+
             # Get the relative path to the Dockerfile
             if dockerfile_path is None:
                 dockerfile_path = config.app.default_dockerfile_path
             
             # Stage the Dockerfile
             self.repo.git.add(dockerfile_path)
-            
-            # Check if there are changes to commit
-            if not self.repo.is_dirty():
+
+            # Check whether the staged Dockerfile actually changed; diffing
+            # just that path is bounded work, unlike is_dirty()'s walk over
+            # every tracked file
+            if not self.repo.index.diff("HEAD", paths=[dockerfile_path]):
                 return False, "No changes to commit"
             
             # Commit the changes
             self.repo.git.commit("-m", message)
+            self._dockerfile_paths = None
+            self._invalidate_info_caches()
             return True, f"Successfully committed changes with message: {message}"
-        except GitCommandError as e:
+        except git.GitCommandError as e:
             return False, f"Git error: {str(e)}"
         except Exception as e:
             return False, f"Error committing changes: {str(e)}"
 
+    def _ensure_git_identity(self):
+        """
+        Make sure the repository's git identity matches the configuration.
+
+        Earlier code opened, parsed and rewrote .git/config twice on every
+        commit. This reads the current identity once and only writes — in a
+        single config_writer pass — when it actually differs, at most once
+        per handler lifetime.
+        """
+        if self._identity_ensured or not (config.git.username and config.git.email):
+            return
+
+        with self.repo.config_reader() as reader:
+            current_name = reader.get_value("user", "name", default=None)
+            current_email = reader.get_value("user", "email", default=None)
+
+        if current_name != config.git.username or current_email != config.git.email:
+            with self.repo.config_writer() as writer:
+                writer.set_value("user", "name", config.git.username)
+                writer.set_value("user", "email", config.git.email)
+
+        self._identity_ensured = True
+
     def push_changes(self) -> Tuple[bool, str]:
         """
         Push committed changes to the remote repository.
@@ -217,6 +397,7 @@ class GitHandler:
         Returns:
             Tuple of (success, message)
         """
+        git = _load_git()
         try:
             if self.repo is None:
                 return False, "Repository not initialized"
@@ -228,9 +409,10 @@ class GitHandler:
             # Check if push was successful
             if push_info[0].flags & push_info[0].ERROR:
                 return False, f"Error pushing changes: {push_info[0].summary}"
-            
+
+            self._invalidate_info_caches()
             return True, "Successfully pushed changes to remote repository"
-        except GitCommandError as e:
+        except git.GitCommandError as e:
             return False, f"Git error: {str(e)}"
         except Exception as e:
             return False, f"Error pushing changes: {str(e)}"
@@ -244,16 +426,52 @@ class GitHandler:
         """
         if self.repo is None:
             return []
-        
+
+        # Reuse the cached scan; the result only changes when the tree does
+        if self._dockerfile_paths is not None:
+            return self._dockerfile_paths
+
         dockerfile_paths = []
-        for root, _, files in os.walk(self.repo_path):
-            for file in files:
-                if file == "Dockerfile" or file.endswith(".dockerfile") or file.endswith(".Dockerfile"):
-                    rel_path = os.path.relpath(os.path.join(root, file), self.repo_path)
+        git = _load_git()
+        try:
+            # The git index already knows every tracked path, so ls-files
+            # avoids stat-ing the working tree entirely
+            for rel_path in self.repo.git.ls_files().splitlines():
+                name = rel_path.rsplit("/", 1)[-1]
+                if name == "Dockerfile" or name.endswith(_DOCKERFILE_SUFFIXES):
                     dockerfile_paths.append(rel_path)
-        
+        except git.GitCommandError:
+            # Fall back to a filesystem scan (also picks up untracked files)
+            dockerfile_paths.extend(self._scan_dockerfiles(str(self.repo_path)))
+
+        self._dockerfile_paths = dockerfile_paths
         return dockerfile_paths
-        
+
+    def _scan_dockerfiles(self, root: str):
+        """
+        Scan a directory tree for Dockerfiles using os.scandir.
+
+        DirEntry carries the file type from the directory read, so the
+        scan avoids a stat per entry, and VCS/build directories are
+        pruned before descending into them.
+
+        Args:
+            root: Absolute directory to scan
+
+        Yields:
+            Dockerfile paths relative to the repository root
+        """
+        repo_root = str(self.repo_path)
+        with os.scandir(root) as entries:
+            for entry in entries:
+                name = entry.name
+                if entry.is_dir(follow_symlinks=False):
+                    if name not in _SCAN_SKIP_DIRS:
+                        yield from self._scan_dockerfiles(entry.path)
+                elif name == "Dockerfile" or name.endswith(_DOCKERFILE_SUFFIXES):
+                    if entry.is_file(follow_symlinks=False):
+                        yield os.path.relpath(entry.path, repo_root)
+
     def get_latest_commit_info(self) -> Tuple[bool, dict]:
         """
         Get information about the latest commit.
@@ -265,10 +483,14 @@ class GitHandler:
         try:
             if self.repo is None:
                 return False, {"error": "Repository not initialized"}
-            
+
             # Get the latest commit
             commit = self.repo.head.commit
-            
+
+            # Reading the SHA is cheap; reuse the cached dict until HEAD moves
+            if self._commit_info_cache is not None and self._commit_info_cache[0] == commit.hexsha:
+                return True, self._commit_info_cache[1]
+
             # Format the commit info
             commit_info = {
                 "id": commit.hexsha[:8],
@@ -277,7 +499,8 @@ class GitHandler:
                 "date": commit.committed_datetime.strftime("%Y-%m-%d %H:%M:%S"),
                 "full_id": commit.hexsha
             }
-            
+
+            self._commit_info_cache = (commit.hexsha, commit_info)
             return True, commit_info
         except Exception as e:
             return False, {"error": f"Error getting commit info: {str(e)}"}
@@ -296,14 +519,23 @@ class GitHandler:
             
             # Get the current branch
             branch = self.repo.active_branch
-            
-            # Get the tracking branch if available
+
+            cache_key = f"{branch.name}@{self.repo.head.commit.hexsha}"
+            if self._branch_info_cache is not None and self._branch_info_cache[0] == cache_key:
+                return True, self._branch_info_cache[1]
+
+            # Get the tracking branch if available. The config reader parses
+            # .git/config in-process, unlike repo.git.config which forks a
+            # git subprocess per lookup
             tracking_branch = None
             try:
-                tracking_branch = self.repo.git.config(f"branch.{branch.name}.remote")
-                if tracking_branch:
-                    tracking_branch = f"{tracking_branch}/{self.repo.git.config(f'branch.{branch.name}.merge').split('/')[-1]}"
-            except:
+                with self.repo.config_reader() as reader:
+                    section = f'branch "{branch.name}"'
+                    remote = reader.get_value(section, "remote")
+                    if remote:
+                        merge_ref = str(reader.get_value(section, "merge"))
+                        tracking_branch = f"{remote}/{merge_ref.split('/')[-1]}"
+            except Exception:
                 pass
             
             # Format the branch info
@@ -311,7 +543,8 @@ class GitHandler:
                 "name": branch.name,
                 "tracking_branch": tracking_branch
             }
-            
+
+            self._branch_info_cache = (cache_key, branch_info)
             return True, branch_info
         except Exception as e:
             return False, {"error": f"Error getting branch info: {str(e)}"}
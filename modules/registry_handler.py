@@ -1,15 +1,30 @@
 """Docker registry operations module."""
 
 import json
-import requests
-import urllib3
+import base64
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List, Optional, Tuple, Any
 from urllib.parse import urljoin
 
 from config import config
 
-# Suppress SSL warnings for local development
-urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
+# requests (and urllib3) are imported on first handler construction; at
+# module import time they would add to Streamlit cold-start even when the
+# registry tab is never opened
+requests = None
+
+
+def _load_requests():
+    """Import requests once, on the first handler construction."""
+    global requests
+    if requests is None:
+        import requests as _requests
+        import urllib3
+
+        # Suppress SSL warnings for local development
+        urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
+        requests = _requests
+    return requests
 
 
 class RegistryHandler:
@@ -31,20 +46,38 @@ class RegistryHandler:
         
         self.api_url = urljoin(self.registry_url, "v2/")
 
+        # Shared session so parallel tag/manifest requests reuse pooled
+        # TCP connections instead of handshaking per call
+        requests = _load_requests()
+        from urllib3.util.retry import Retry
+
+        self._max_workers = 8
+        self._session = requests.Session()
+        adapter = requests.adapters.HTTPAdapter(
+            pool_connections=self._max_workers,
+            pool_maxsize=self._max_workers,
+            max_retries=Retry(total=3, backoff_factor=0.2)
+        )
+        self._session.mount("http://", adapter)
+        self._session.mount("https://", adapter)
+
+        # Credentials never change for the handler's lifetime, so encode
+        # the Authorization header once instead of per request
+        if self.username and self.password:
+            auth_string = f"{self.username}:{self.password}"
+            encoded_auth = base64.b64encode(auth_string.encode()).decode()
+            self._auth_headers = {"Authorization": f"Basic {encoded_auth}"}
+        else:
+            self._auth_headers = {}
+
     def _get_auth_header(self) -> Dict[str, str]:
         """
         Get authentication header for registry API requests.
 
         Returns:
-            Authentication header dict
+            Authentication header dict (precomputed in __init__)
         """
-        headers = {}
-        if self.username and self.password:
-            import base64
-            auth_string = f"{self.username}:{self.password}"
-            encoded_auth = base64.b64encode(auth_string.encode()).decode()
-            headers["Authorization"] = f"Basic {encoded_auth}"
-        return headers
+        return self._auth_headers
 
     def check_connection(self) -> Tuple[bool, str]:
         """
@@ -59,9 +92,9 @@ class RegistryHandler:
             print(f"API URL: {self.api_url}")
             
             # Try with a longer timeout
-            response = requests.get(
+            response = self._session.get(
                 self.api_url,
-                headers=self._get_auth_header(),
+                headers=self._auth_headers,
                 timeout=10,
                 verify=False  # Disable SSL verification for local registries
             )
@@ -83,18 +116,32 @@ class RegistryHandler:
             Tuple of (success, repositories list, message)
         """
         try:
-            response = requests.get(
-                urljoin(self.api_url, "_catalog"),
-                headers=self._get_auth_header(),
-                timeout=10
-            )
-            
-            if response.status_code == 200:
-                data = response.json()
-                repositories = data.get("repositories", [])
-                return True, repositories, f"Found {len(repositories)} repositories"
-            else:
-                return False, [], f"Failed to list repositories: {response.status_code} {response.reason}"
+            repositories = []
+            url = urljoin(self.api_url, "_catalog")
+            # Ask for large pages and follow the Link header; registries cap
+            # unpaginated catalog responses, so without this the list is
+            # silently truncated for large registries
+            params = {"n": 1000}
+
+            while url:
+                response = self._session.get(
+                    url,
+                    headers=self._auth_headers,
+                    params=params,
+                    timeout=10
+                )
+
+                if response.status_code != 200:
+                    return False, [], f"Failed to list repositories: {response.status_code} {response.reason}"
+
+                repositories.extend(response.json().get("repositories", []))
+
+                next_link = response.links.get("next", {}).get("url")
+                url = urljoin(self.api_url, next_link) if next_link else None
+                # The next-page URL already carries the pagination query
+                params = None
+
+            return True, repositories, f"Found {len(repositories)} repositories"
         except requests.RequestException as e:
             return False, [], f"Error listing repositories: {str(e)}"
         except json.JSONDecodeError:
@@ -111,9 +158,9 @@ class RegistryHandler:
             Tuple of (success, tags list, message)
         """
         try:
-            response = requests.get(
+            response = self._session.get(
                 urljoin(self.api_url, f"{repository}/tags/list"),
-                headers=self._get_auth_header(),
+                headers=self._auth_headers,
                 timeout=10
             )
             
@@ -142,11 +189,12 @@ class RegistryHandler:
             Tuple of (success, manifest dict, message)
         """
         try:
-            headers = self._get_auth_header()
-            # Add accept headers for manifest v2
-            headers["Accept"] = "application/vnd.docker.distribution.manifest.v2+json"
+            # Add accept headers for manifest v2 (copy: the shared auth
+            # header dict must not be mutated)
+            headers = {**self._auth_headers,
+                       "Accept": "application/vnd.docker.distribution.manifest.v2+json"}
             
-            response = requests.get(
+            response = self._session.get(
                 urljoin(self.api_url, f"{repository}/manifests/{tag}"),
                 headers=headers,
                 timeout=10
@@ -176,19 +224,33 @@ class RegistryHandler:
             Tuple of (success, message)
         """
         try:
-            # First, get the digest for the image
-            success, manifest, message = self.get_image_manifest(repository, tag)
-            if not success:
-                return False, message
-            
-            digest = manifest.get("config", {}).get("digest")
+            # Resolve the manifest digest with a HEAD request; the registry
+            # returns it in the Docker-Content-Digest header, so there is no
+            # body to download or parse
+            response = self._session.head(
+                urljoin(self.api_url, f"{repository}/manifests/{tag}"),
+                headers={**self._auth_headers,
+                         "Accept": "application/vnd.docker.distribution.manifest.v2+json"},
+                timeout=10
+            )
+            if response.status_code == 404:
+                return False, f"Image {repository}:{tag} not found"
+
+            digest = response.headers.get("Docker-Content-Digest")
             if not digest:
-                return False, "Could not determine image digest"
-            
+                # Registry didn't send the header; fall back to fetching the
+                # full manifest
+                success, manifest, message = self.get_image_manifest(repository, tag)
+                if not success:
+                    return False, message
+                digest = manifest.get("config", {}).get("digest")
+                if not digest:
+                    return False, "Could not determine image digest"
+
             # Delete the image using the digest
-            response = requests.delete(
+            response = self._session.delete(
                 urljoin(self.api_url, f"{repository}/manifests/{digest}"),
-                headers=self._get_auth_header(),
+                headers=self._auth_headers,
                 timeout=10
             )
             
@@ -214,44 +276,63 @@ class RegistryHandler:
             success, repositories, message = self.list_repositories()
             if not success:
                 return False, [], message
-                
-            # For each repository, get its tags and build the image list
+
+            # Enumerate tags and manifests for all repositories in parallel;
+            # the work is network-latency-bound, so the fan-out finishes in
+            # roughly the slowest repository's time instead of the sum
             images = []
-            for repo in repositories:
-                tag_success, tags, tag_message = self.list_tags(repo)
-                if tag_success and tags:
-                    # Get additional information for each tag if available
-                    tag_details = []
-                    for tag in tags:
-                        # Try to get manifest to extract creation date and size if available
-                        manifest_success, manifest, _ = self.get_image_manifest(repo, tag)
-                        created = ""
-                        size = 0
-                        if manifest_success and manifest:
-                            # Try to extract creation date and size from manifest
-                            # This might vary depending on registry implementation
-                            if "history" in manifest and manifest["history"]:
-                                try:
-                                    v1_compat = json.loads(manifest["history"][0].get("v1Compatibility", "{}"))
-                                    created = v1_compat.get("created", "")
-                                except (json.JSONDecodeError, IndexError):
-                                    pass
-                                    
-                            # Calculate size from layers if available
-                            if "layers" in manifest:
-                                size = sum(layer.get("size", 0) for layer in manifest["layers"])
-                                
-                        tag_details.append({
-                            "tag": tag,
-                            "created": created,
-                            "size": size
-                        })
-                        
-                    images.append({
-                        "repository": repo,
-                        "tags": tag_details
-                    })
-                    
+            if repositories:
+                with ThreadPoolExecutor(max_workers=self._max_workers) as executor:
+                    for image in executor.map(self._describe_repository, repositories):
+                        if image is not None:
+                            images.append(image)
+
             return True, images, f"Found {len(images)} repositories with images"
         except Exception as e:
             return False, [], f"Error listing all images: {str(e)}"
+
+    def _describe_repository(self, repo: str) -> Optional[Dict[str, Any]]:
+        """
+        Collect tag details (creation date and size) for one repository.
+
+        Args:
+            repo: Repository name
+
+        Returns:
+            Image dict with 'repository' and 'tags' keys, or None if the
+            repository has no tags
+        """
+        tag_success, tags, _ = self.list_tags(repo)
+        if not tag_success or not tags:
+            return None
+
+        tag_details = []
+        for tag in tags:
+            # Try to get manifest to extract creation date and size if available
+            manifest_success, manifest, _ = self.get_image_manifest(repo, tag)
+            created = ""
+            size = 0
+            if manifest_success and manifest:
+                # Try to extract creation date and size from manifest
+                # This might vary depending on registry implementation
+                if "history" in manifest and manifest["history"]:
+                    try:
+                        v1_compat = json.loads(manifest["history"][0].get("v1Compatibility", "{}"))
+                        created = v1_compat.get("created", "")
+                    except (json.JSONDecodeError, IndexError):
+                        pass
+
+                # Calculate size from layers if available
+                if "layers" in manifest:
+                    size = sum(layer.get("size", 0) for layer in manifest["layers"])
+
+            tag_details.append({
+                "tag": tag,
+                "created": created,
+                "size": size
+            })
+
+        return {
+            "repository": repo,
+            "tags": tag_details
+        }
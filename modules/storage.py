@@ -5,11 +5,30 @@ Persistent storage module for Docker Web UI application.
 import os
 import json
 import sqlite3
+import threading
 from pathlib import Path
 from typing import Dict, Any, Optional, List, Tuple
 
 from config import config
 
+# Use orjson for setting (de)serialization when available; it runs in C
+# and is a drop-in for the subset of JSON stored here. The stdlib json
+# module remains the fallback since orjson is an optional dependency.
+try:
+    import orjson
+
+    def _loads(text):
+        return orjson.loads(text)
+
+    def _dumps(value):
+        return orjson.dumps(value).decode('utf-8')
+
+    _JSONDecodeError = orjson.JSONDecodeError
+except ImportError:
+    _loads = json.loads
+    _dumps = json.dumps
+    _JSONDecodeError = json.JSONDecodeError
+
 
 class Storage:
     """Handles persistent storage operations using SQLite."""
@@ -25,14 +44,35 @@ class Storage:
             db_path = config.app.temp_dir / 'settings.db'
         
         self.db_path = db_path
+        # Serialize writes; Streamlit may call into storage from multiple
+        # script-run threads sharing this connection
+        self._lock = threading.Lock()
+        # Write-through settings cache; the table is config-scale, so the
+        # whole thing is loaded on first read and kept in sync on writes
+        self._cache: Dict[str, Any] = {}
+        self._cache_loaded = False
         self._initialize_db()
     
     def _initialize_db(self):
         """Initialize the database with required tables."""
         os.makedirs(self.db_path.parent, exist_ok=True)
-        
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
+
+        # One persistent connection per Storage instance; WAL lets readers
+        # and the writer proceed without blocking each other and cuts the
+        # per-call file-open and journal-creation overhead
+        self._conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        # page_size only takes effect if set before the first table is
+        # created, so it must precede the CREATE TABLE statements below
+        self._conn.execute('PRAGMA page_size=4096')
+        self._conn.execute('PRAGMA journal_mode=WAL')
+        self._conn.execute('PRAGMA synchronous=NORMAL')
+        self._conn.execute('PRAGMA temp_store=MEMORY')
+        # Map the file into memory so reads go through page-cache pointers
+        # instead of read(2) copies; ~2 MB of page cache covers the whole DB
+        self._conn.execute('PRAGMA mmap_size=67108864')
+        self._conn.execute('PRAGMA cache_size=-2000')
+
+        cursor = self._conn.cursor()
         
         # Create settings table
         cursor.execute('''
@@ -50,9 +90,15 @@ class Storage:
             last_used TIMESTAMP DEFAULT CURRENT_TIMESTAMP
         )
         ''')
-        
-        conn.commit()
-        conn.close()
+
+        # Let get_recent_repositories resolve its ORDER BY ... LIMIT with an
+        # index-range scan instead of sorting the table
+        cursor.execute('''
+        CREATE INDEX IF NOT EXISTS idx_git_repos_last_used
+        ON git_repositories(last_used DESC)
+        ''')
+
+        self._conn.commit()
     
     def get_setting(self, key: str, default: Any = None) -> Any:
         """
@@ -65,20 +111,38 @@ class Storage:
         Returns:
             Setting value or default if not found
         """
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        cursor.execute('SELECT value FROM settings WHERE key = ?', (key,))
-        result = cursor.fetchone()
-        
-        conn.close()
-        
-        if result:
-            try:
-                return json.loads(result[0])
-            except json.JSONDecodeError:
-                return result[0]
-        return default
+        if not self._cache_loaded:
+            self._load_cache()
+        return self._cache.get(key, default)
+
+    def get_settings(self, defaults: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Get several settings in one trip.
+
+        Args:
+            defaults: Mapping of setting keys to their default values
+
+        Returns:
+            Mapping of each requested key to its stored value, or the
+            given default when the key is not set
+        """
+        # The settings table is config-scale, so one full load into the
+        # cache is cheaper than a parameterized IN query per caller
+        if not self._cache_loaded:
+            self._load_cache()
+        return {key: self._cache.get(key, default) for key, default in defaults.items()}
+
+    def _load_cache(self):
+        """Load all settings into the in-memory cache in one query."""
+        with self._lock:
+            if self._cache_loaded:
+                return
+            for key, value in self._conn.execute('SELECT key, value FROM settings'):
+                try:
+                    self._cache[key] = _loads(value)
+                except _JSONDecodeError:
+                    self._cache[key] = value
+            self._cache_loaded = True
     
     def set_setting(self, key: str, value: Any) -> bool:
         """
@@ -91,22 +155,49 @@ class Storage:
         Returns:
             True if successful
         """
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
         # Convert value to JSON string if it's not a string
-        if not isinstance(value, str):
-            value = json.dumps(value)
-        
-        cursor.execute(
-            'INSERT OR REPLACE INTO settings (key, value) VALUES (?, ?)',
-            (key, value)
-        )
-        
-        conn.commit()
-        conn.close()
+        if isinstance(value, str):
+            stored = value
+        else:
+            stored = _dumps(value)
+
+        with self._lock, self._conn:
+            # DO UPDATE rewrites the value in place; INSERT OR REPLACE would
+            # delete and re-insert the row
+            self._conn.execute(
+                'INSERT INTO settings (key, value) VALUES (?, ?) '
+                'ON CONFLICT(key) DO UPDATE SET value = excluded.value',
+                (key, stored)
+            )
+            self._cache[key] = value
         return True
-    
+
+    def set_settings(self, items: Dict[str, Any]) -> bool:
+        """
+        Set multiple settings in a single transaction.
+
+        Args:
+            items: Mapping of setting keys to values (non-strings are JSON serialized)
+
+        Returns:
+            True if successful
+        """
+        pairs = [
+            (key, value if isinstance(value, str) else _dumps(value))
+            for key, value in items.items()
+        ]
+
+        # One transaction (and one fsync) for the whole batch instead of
+        # one per setting
+        with self._lock, self._conn:
+            self._conn.executemany(
+                'INSERT INTO settings (key, value) VALUES (?, ?) '
+                'ON CONFLICT(key) DO UPDATE SET value = excluded.value',
+                pairs
+            )
+            self._cache.update(items)
+        return True
+
     def delete_setting(self, key: str) -> bool:
         """
         Delete a setting by key.
@@ -117,13 +208,9 @@ class Storage:
         Returns:
             True if successful
         """
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        cursor.execute('DELETE FROM settings WHERE key = ?', (key,))
-        
-        conn.commit()
-        conn.close()
+        with self._lock, self._conn:
+            self._conn.execute('DELETE FROM settings WHERE key = ?', (key,))
+            self._cache.pop(key, None)
         return True
     
     def add_git_repository(self, url: str, branch: str) -> bool:
@@ -137,16 +224,14 @@ class Storage:
         Returns:
             True if successful
         """
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        cursor.execute(
-            'INSERT OR REPLACE INTO git_repositories (url, branch, last_used) VALUES (?, ?, CURRENT_TIMESTAMP)',
-            (url, branch)
-        )
-        
-        conn.commit()
-        conn.close()
+        with self._lock, self._conn:
+            self._conn.execute(
+                'INSERT INTO git_repositories (url, branch, last_used) '
+                'VALUES (?, ?, CURRENT_TIMESTAMP) '
+                'ON CONFLICT(url) DO UPDATE SET '
+                'branch = excluded.branch, last_used = CURRENT_TIMESTAMP',
+                (url, branch)
+            )
         return True
     
     def get_recent_repositories(self, limit: int = 5) -> List[Dict[str, str]]:
@@ -159,17 +244,12 @@ class Storage:
         Returns:
             List of repository dictionaries with 'url' and 'branch' keys
         """
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        cursor.execute(
+        cursor = self._conn.execute(
             'SELECT url, branch FROM git_repositories ORDER BY last_used DESC LIMIT ?',
             (limit,)
         )
         results = cursor.fetchall()
-        
-        conn.close()
-        
+
         return [{'url': url, 'branch': branch} for url, branch in results]
 
 
@@ -3,41 +3,96 @@ Application state initialization and management.
 """
 
 import os
+import hashlib
+from collections import deque
 import streamlit as st
 
-from modules import GitHandler, RegistryHandler
-from modules.docker_cli_handler import DockerCLIHandler
 from modules.storage import storage  # Add this import
 from config import config
 
+# Process-local store of Dockerfile texts keyed by content hash. Session
+# state only carries the small hash, not the (possibly large) text.
+_dockerfile_texts = {}
+_DOCKERFILE_STORE_LIMIT = 8
+
+# Maximum build-log lines retained for the Logs tab
+_BUILD_LOG_LINES = 2000
+
+
+def set_dockerfile_content(content: str):
+    """Store Dockerfile text and keep only its hash in session state."""
+    content_hash = hashlib.blake2b(content.encode(), digest_size=16).hexdigest()
+    # Pop before re-inserting so a re-set moves the entry to the end of
+    # the dict's insertion order; eviction below is then least-recently-
+    # written rather than first-ever-written
+    _dockerfile_texts.pop(content_hash, None)
+    _dockerfile_texts[content_hash] = content
+    # Keep the store bounded; drop the oldest entries first
+    while len(_dockerfile_texts) > _DOCKERFILE_STORE_LIMIT:
+        _dockerfile_texts.pop(next(iter(_dockerfile_texts)))
+    st.session_state.dockerfile_hash = content_hash
+
+
+def get_dockerfile_content() -> str:
+    """Fetch the Dockerfile text referenced by the hash in session state."""
+    content_hash = st.session_state.get("dockerfile_hash", "")
+    if not content_hash:
+        return ""
+    content = _dockerfile_texts.get(content_hash)
+    if content is not None:
+        return content
+    # The store is process-global, so another session's edits can have
+    # evicted this entry; re-read the Dockerfile from the working tree
+    # instead of silently rendering an empty editor
+    git_handler = st.session_state.get("git_handler")
+    if git_handler is not None:
+        success, text = git_handler.read_dockerfile(
+            st.session_state.get("dockerfile_path", "Dockerfile")
+        )
+        if success:
+            set_dockerfile_content(text)
+            return text
+    return ""
+
 
 def init_session_state():
     """Initialize the session state variables."""
+    # Load all persisted settings in one storage trip
+    settings = storage.get_settings({
+        "git_repo_url": "",
+        "git_branch": "main",
+        "repository": "",
+        "tag": "latest",
+        "registry_url": config.registry.url,
+    })
+
     # Load git repository settings from persistent storage
     if "git_repo_url" not in st.session_state:
-        st.session_state.git_repo_url = storage.get_setting("git_repo_url", "")
+        st.session_state.git_repo_url = settings["git_repo_url"]
     if "git_branch" not in st.session_state:
-        st.session_state.git_branch = storage.get_setting("git_branch", "main")
+        st.session_state.git_branch = settings["git_branch"]
     if "previous_repo_url" not in st.session_state:
         st.session_state.previous_repo_url = ""
     if "previous_branch" not in st.session_state:
         st.session_state.previous_branch = ""
     if "dockerfile_path" not in st.session_state:
         st.session_state.dockerfile_path = "Dockerfile"
-    if "dockerfile_content" not in st.session_state:
-        st.session_state.dockerfile_content = ""
+    if "dockerfile_hash" not in st.session_state:
+        st.session_state.dockerfile_hash = ""
     if "build_success" not in st.session_state:
         st.session_state.build_success = False
     if "image_id" not in st.session_state:
         st.session_state.image_id = None
     if "build_logs" not in st.session_state:
-        st.session_state.build_logs = ""
+        # Bounded line buffer: long builds can emit far more output than is
+        # worth re-rendering, and a deque caps both memory and frontend work
+        st.session_state.build_logs = deque(maxlen=_BUILD_LOG_LINES)
         
     # Load Docker image settings from persistent storage
     if "repository" not in st.session_state:
-        st.session_state.repository = storage.get_setting("repository", "")
+        st.session_state.repository = settings["repository"]
     if "tag" not in st.session_state:
-        st.session_state.tag = storage.get_setting("tag", "latest")
+        st.session_state.tag = settings["tag"]
     if "commit_message" not in st.session_state:
         st.session_state.commit_message = ""
     if "git_handler" not in st.session_state:
@@ -51,7 +106,7 @@ def init_session_state():
         
     # Load registry settings from persistent storage
     if "registry_url" not in st.session_state:
-        registry_url = storage.get_setting("registry_url", config.registry.url)
+        registry_url = settings["registry_url"]
         st.session_state.registry_url = registry_url
         # Update config with persisted registry URL
         config.registry.url = registry_url
@@ -61,12 +116,38 @@ def init_session_state():
         st.session_state.recent_repositories = storage.get_recent_repositories()
 
 
+@st.cache_resource(show_spinner=False)
+def get_docker_handler():
+    """Create the DockerCLIHandler once per process.
+
+    The constructor shells out to `docker version`, so caching it as a
+    resource avoids a fork/exec on every Streamlit rerun. The handler
+    serializes access to its shared Engine API connection internally, so
+    sharing it across sessions is safe.
+    """
+    from modules.docker_cli_handler import DockerCLIHandler
+    return DockerCLIHandler()
+
+
+@st.cache_resource(show_spinner=False)
+def get_registry_handler(registry_url: str):
+    """Create one RegistryHandler per registry URL, shared across sessions.
+
+    The handler holds a pooled HTTP session whose connections stay warm
+    across reruns. Keying on the URL means changing the registry in the
+    settings builds a fresh handler instead of reusing a stale one. The
+    handler carries no user-scoped state, so sharing it is safe.
+    """
+    from modules import RegistryHandler
+    return RegistryHandler()
+
+
 def init_handlers():
     """Initialize handlers for Docker and Registry operations."""
     try:
         # Use the CLI handler instead of the SDK handler
-        st.session_state.docker_handler = DockerCLIHandler()
-        st.session_state.registry_handler = RegistryHandler()
+        st.session_state.docker_handler = get_docker_handler()
+        st.session_state.registry_handler = get_registry_handler(config.registry.url)
     except Exception as e:
         st.error(f"Error initializing handlers: {str(e)}")
 
@@ -82,6 +163,8 @@ def reload_repository():
         # Silently try to re-clone the repository
         try:
             # Create a new GitHandler instance
+            from modules import GitHandler
+
             st.session_state.git_handler = GitHandler(st.session_state.git_repo_url, st.session_state.git_branch)
             
             # Check if the repository directory exists
@@ -102,9 +185,8 @@ def reload_repository():
 
 
 def save_git_repository_settings(url: str, branch: str):
-    # Save to persistent storage
-    storage.set_setting("git_repo_url", url)
-    storage.set_setting("git_branch", branch)
+    # Save to persistent storage in one transaction
+    storage.set_settings({"git_repo_url": url, "git_branch": branch})
     
     # Add to recent repositories
     if url:
@@ -123,6 +205,5 @@ def save_registry_settings(registry_url: str):
 
 
 def save_docker_image_settings(repository: str, tag: str):
-    # Save to persistent storage
-    storage.set_setting("repository", repository)
-    storage.set_setting("tag", tag)
\ No newline at end of file
+    # Save to persistent storage in one transaction
+    storage.set_settings({"repository": repository, "tag": tag})
\ No newline at end of file
@@ -3,7 +3,6 @@ UI components for the Docker Web UI application.
 """
 
 import streamlit as st
-from streamlit_ace import st_ace
 import streamlit.components.v1 as components
 from typing import Tuple, Dict, Any, Optional
 
@@ -12,88 +11,107 @@ from utils import validate_git_url, validate_docker_repository, validate_docker_
 from utils.formatters import format_registry_url
 from config import config
 
-# In the repository_settings_dialog function, update the code to:
+@st.cache_data(show_spinner=False)
+def _format_repo_options(repo_key: Tuple[Tuple[str, str], ...]) -> list:
+    """Format the recent-repository labels once per distinct list.
+
+    Keyed on a (url, branch) tuple snapshot, so the f-string pass only
+    reruns when the recent list actually changes.
+    """
+    return ["Select a recent repository"] + [f"{url} ({branch})" for url, branch in repo_key]
+
 
 @st.dialog("Repository Settings", width="small")
 def repository_settings_dialog(clone_repository_callback, load_dockerfile_callback):
     """Render the repository settings as a dialog."""
-    # Git repository URL
-    repo_url = st.text_input(
-        "Git Repository URL",
-        value=st.session_state.git_repo_url,
-        placeholder="https://github.com/username/repo.git",
-        help="URL of the Git repository containing the Dockerfile"
-    )
-    
-    # Recent repositories dropdown
+    # Recent repositories dropdown. Kept outside the form because selecting
+    # one updates the default values the form fields render with
     if "recent_repositories" in st.session_state and st.session_state.recent_repositories:
         recent_repos = st.session_state.recent_repositories
-        repo_options = [f"{repo['url']} ({repo['branch']})" for repo in recent_repos]
-        repo_options.insert(0, "Select a recent repository")
-        
-        selected_repo = st.selectbox(
+
+        # Select by index and format for display only; this avoids parsing
+        # url/branch back out of the label (brittle for URLs containing
+        # parentheses) and the split allocations per rerun
+        repo_key = tuple((repo['url'], repo['branch']) for repo in recent_repos)
+        repo_labels = _format_repo_options(repo_key)
+
+        selected_index = st.selectbox(
             "Recent Repositories",
-            options=repo_options,
-            index=0
+            options=range(len(recent_repos) + 1),
+            index=0,
+            format_func=repo_labels.__getitem__
         )
-        
-        if selected_repo != "Select a recent repository":
-            # Extract URL and branch from selection
-            selected_url = selected_repo.split(" (")[0]
-            selected_branch = selected_repo.split("(")[1].rstrip(")")
-            
+
+        if selected_index:
+            selected = recent_repos[selected_index - 1]
+
             # Use the selected repository if the button is clicked
             if st.button("Use Selected Repository"):
-                repo_url = selected_url
-                st.session_state.git_branch = selected_branch
-    
-    # Git branch
-    branch = st.text_input(
-        "Branch",
-        value=st.session_state.git_branch,
-        placeholder="main",
-        help="Branch to checkout"
-    )
-    
-    # Form submission buttons
-    col1, col2 = st.columns([1, 1])
-    with col1:
-        if st.button("Cancel"):
-            st.rerun()  # Close the dialog by triggering a rerun
-    
-    with col2:
-        if st.button("Clone Repository", type="primary"):
-            # Validate Git URL
-            is_valid, error_message = validate_git_url(repo_url)
-            if not is_valid:
-                st.error(error_message)
-            else:
-                # Store in session state for persistence
-                st.session_state.git_repo_url = repo_url
-                st.session_state.git_branch = branch
+                st.session_state.git_repo_url = selected['url']
+                st.session_state.git_branch = selected['branch']
+
+    # Batch the text inputs in a form so typing doesn't trigger a rerun
+    # per keystroke; the script only reruns on submission
+    with st.form("repo_settings_form"):
+        # Git repository URL
+        repo_url = st.text_input(
+            "Git Repository URL",
+            value=st.session_state.git_repo_url,
+            placeholder="https://github.com/username/repo.git",
+            help="URL of the Git repository containing the Dockerfile"
+        )
+
+        # Git branch
+        branch = st.text_input(
+            "Branch",
+            value=st.session_state.git_branch,
+            placeholder="main",
+            help="Branch to checkout"
+        )
+
+        # Form submission buttons
+        col1, col2 = st.columns([1, 1])
+        with col1:
+            cancelled = st.form_submit_button("Cancel")
+        with col2:
+            submitted = st.form_submit_button("Clone Repository", type="primary")
+
+    if cancelled:
+        st.rerun()  # Close the dialog by triggering a rerun
+
+    if submitted:
+        # Validate Git URL
+        is_valid, error_message = validate_git_url(repo_url)
+        if not is_valid:
+            st.error(error_message)
+        else:
+            # Store in session state for persistence
+            st.session_state.git_repo_url = repo_url
+            st.session_state.git_branch = branch
                 
-                # Save to persistent storage
-                from ui.app_state import save_git_repository_settings
-                save_git_repository_settings(repo_url, branch)
+            # Save to persistent storage
+            from ui.app_state import save_git_repository_settings
+            save_git_repository_settings(repo_url, branch)
                 
-                # Clear previous repository data if URL or branch changed
-                if ("previous_repo_url" in st.session_state and 
-                    (st.session_state.previous_repo_url != repo_url or 
-                     st.session_state.previous_branch != branch)):
-                    # Clear previous repository data
-                    st.session_state.dockerfile_content = ""
-                    st.session_state.available_dockerfiles = []
-                    st.session_state.build_logs = ""
-                    st.session_state.build_success = False
-                    st.session_state.image_id = None
+            # Clear previous repository data if URL or branch changed
+            if ("previous_repo_url" in st.session_state and 
+                (st.session_state.previous_repo_url != repo_url or 
+                 st.session_state.previous_branch != branch)):
+                # Clear previous repository data
+                from ui.app_state import set_dockerfile_content
+                set_dockerfile_content("")
+                st.session_state.available_dockerfiles = []
+                st.session_state.build_logs.clear()
+                st.session_state.build_success = False
+                st.session_state.image_id = None
                 
-                # Clone the repository
-                if clone_repository_callback(repo_url, branch):
-                    # Store current repo info for comparison on next clone
-                    st.session_state.previous_repo_url = repo_url
-                    st.session_state.previous_branch = branch
-                    load_dockerfile_callback(silent=False)
-                    st.rerun()  # Close the dialog and refresh the app
+            # Clone the repository
+            if clone_repository_callback(repo_url, branch):
+                # Store current repo info for comparison on next clone
+                st.session_state.previous_repo_url = repo_url
+                st.session_state.previous_branch = branch
+                load_dockerfile_callback(silent=False)
+                st.rerun()  # Close the dialog and refresh the app
 
 def render_repository_settings_modal(clone_repository_callback, load_dockerfile_callback):
     """Legacy function to maintain compatibility - now uses st.dialog."""
@@ -115,8 +133,8 @@ def render_repository_info(git_handler: Optional[GitHandler] = None):
         branch_success, branch_info = git_handler.get_branch_info()
         
         if success:
-            import pandas as pd
-            # Create table data as dictionary
+            # Six key/value rows don't warrant importing pandas and building
+            # a DataFrame on every sidebar redraw; hand the rows to st.table
             table_data = {
                 "Repo": git_handler.repo_name,
                 "Branch": branch_info['name'] if branch_success else git_handler.branch,
@@ -125,9 +143,7 @@ def render_repository_info(git_handler: Optional[GitHandler] = None):
                 "Author": commit_info['author'].split('<')[0],
                 "Date": commit_info['date']
             }
-            # Convert to DataFrame and display without index
-            df = pd.DataFrame(list(table_data.items()), columns=["Field", "Value"])
-            st.dataframe(df, hide_index=True)
+            st.table([{"Field": field, "Value": value} for field, value in table_data.items()])
     else:
         st.info("No repository cloned yet")
 
@@ -199,7 +215,15 @@ def render_sidebar(clone_repository_callback, load_dockerfile_callback, init_han
             save_registry_settings(registry_url)
         
         if st.button("Check Registry Connection"):
-            if st.session_state.registry_handler is None:
+            # Throttle repeat clicks; each check is a blocking network
+            # round-trip, so rapid re-clicks just queue up duplicate calls
+            import time
+
+            last_check = st.session_state.get("last_connection_check_ts", 0.0)
+            now = time.monotonic()
+            if now - last_check < 0.5:
+                st.warning("Please wait before checking the connection again")
+            elif st.session_state.registry_handler is None:
                 st.error("Registry handler not initialized. Please refresh the page.")
                 # Try to initialize handlers again
                 try:
@@ -208,6 +232,7 @@ def render_sidebar(clone_repository_callback, load_dockerfile_callback, init_han
                 except Exception as e:
                     st.error(f"Failed to initialize handlers: {str(e)}")
             else:
+                st.session_state.last_connection_check_ts = now
                 try:
                     success, message = st.session_state.registry_handler.check_connection()
                     if success:
@@ -240,9 +265,13 @@ def render_edit_tab(save_dockerfile_callback):
         # Dockerfile editor with syntax highlighting
         st.markdown("### Dockerfile Content")
         
-        # Use the Ace editor with syntax highlighting
+        # Use the Ace editor with syntax highlighting. Imported here so
+        # sessions that never open the editor skip the component
+        # registration cost (sys.modules makes repeat calls free)
+        from streamlit_ace import st_ace
+        from ui.app_state import get_dockerfile_content, set_dockerfile_content
         dockerfile_content = st_ace(
-            value=st.session_state.dockerfile_content,
+            value=get_dockerfile_content(),
             language="dockerfile",
             theme="monokai",
             font_size=14,
@@ -255,9 +284,9 @@ def render_edit_tab(save_dockerfile_callback):
             tab_size=2
         )
         
-        # Update session state with the editor content
+        # Update the content store with the editor content
         if dockerfile_content:
-            st.session_state.dockerfile_content = dockerfile_content
+            set_dockerfile_content(dockerfile_content)
         
         # Save button
         if st.button("Save Dockerfile"):
@@ -306,14 +335,21 @@ def render_build_tab(repository, tag, build_docker_image_callback):
         st.info("Please clone a Git repository to build a Docker image")
 
 
+@st.fragment
 def render_logs_tab():
-    """Render the Build Logs tab."""
+    """Render the Build Logs tab.
+
+    Runs as a fragment: the log viewer depends only on build_logs, so
+    sidebar keystrokes don't re-render the Ace component.
+    """
     st.header("Build Logs")
     
     if st.session_state.build_logs:
         # Use Ace editor in read-only mode for better log display
+        from streamlit_ace import st_ace
+
         st_ace(
-            value=st.session_state.build_logs,
+            value="\n".join(st.session_state.build_logs),
             language="sh",
             theme="terminal",
             font_size=14,
@@ -358,8 +394,62 @@ def render_publish_tab(push_to_registry_callback, commit_dockerfile_changes_call
         st.info("Build an image successfully before publishing")
 
 
+@st.cache_data(ttl=60, show_spinner=False)
+def _fetch_registry_images(registry_url: str):
+    """Fetch all images from the registry, cached per registry URL.
+
+    The fan-out over repositories is a pile of network round-trips, so
+    reruns within the TTL reuse the cached listing; the Refresh button
+    clears the cache explicitly.
+    """
+    from modules import RegistryHandler
+
+    success, images, message = RegistryHandler().list_all_images()
+    if success:
+        # Precompute the display columns once per fetch so rendering is
+        # pure presentation; reruns then skip the per-tag string work
+        for repo_data in images:
+            repo_data["table"] = _build_tag_table(repo_data["repository"], repo_data["tags"])
+    return success, images, message
+
+
+def _build_tag_table(repository: str, tags: list) -> Dict[str, Any]:
+    """Build display-ready columns for a repository's tag table.
+
+    Columns are built column-wise; for repositories with hundreds of
+    tags this avoids a dict allocation per row plus pandas re-walking
+    those dicts.
+    """
+    import numpy as np
+
+    tag_names = [t["tag"] for t in tags]
+    created_strs = [
+        t["created"][:19].replace("T", " ") if t["created"] else "Unknown"
+        for t in tags
+    ]
+    sizes = np.fromiter((t["size"] for t in tags), dtype=np.int64, count=len(tags))
+    size_strs = np.where(
+        sizes > 0,
+        np.char.add((sizes / 1048576).round(2).astype(str), " MB"),
+        "Unknown"
+    )
+
+    return {
+        "Tag": tag_names,
+        "Created": created_strs,
+        "Size": size_strs,
+        "Full Name": [f"{repository}:{name}" for name in tag_names]
+    }
+
+
+@st.fragment
 def render_registry_images_tab():
-    """Render the Registry Images tab that lists available images remotely in the registry server."""
+    """Render the Registry Images tab that lists available images remotely in the registry server.
+
+    Runs as a fragment so interactions elsewhere in the app (e.g. typing
+    in a sidebar field) rerun only that widget's scope instead of
+    re-walking the registry listing and its expanders.
+    """
     st.header("Registry Images")
     
     # Registry URL information
@@ -371,15 +461,31 @@ def render_registry_images_tab():
     with col1:
         refresh = st.button("🔄 Refresh")
     
+    if refresh:
+        # Same throttle as the connection-check button: a refresh fans out
+        # one request per repository, so back-to-back clicks are all cost
+        import time
+
+        now = time.monotonic()
+        if now - st.session_state.get("last_registry_refresh_ts", 0.0) < 0.5:
+            st.warning("Please wait before refreshing again")
+            refresh = False
+        else:
+            st.session_state.last_registry_refresh_ts = now
+
     # Check connection to registry
     if not hasattr(st.session_state, "registry_images") or refresh:
+        if refresh:
+            # Force a fresh fetch rather than serving the cached listing
+            _fetch_registry_images.clear()
+
         with st.spinner("Connecting to registry..."):
             # Check connection first
             connection_success, connection_message = st.session_state.registry_handler.check_connection()
             
             if connection_success:
-                # List all images
-                success, images, message = st.session_state.registry_handler.list_all_images()
+                # List all images (cached per registry URL)
+                success, images, message = _fetch_registry_images(registry_url)
                 if success:
                     st.session_state.registry_images = images
                     st.session_state.registry_message = message
@@ -394,55 +500,48 @@ def render_registry_images_tab():
     # Display registry images
     if hasattr(st.session_state, "registry_images"):
         if st.session_state.registry_images:
-            # Display images in an expandable format
-            for repo_index, repo_data in enumerate(st.session_state.registry_images):
+            import pandas as pd
+
+            # One flat searchable table instead of an expander + table +
+            # selectbox + button per repository; the per-repo layout put
+            # O(repositories) widgets on the page every rerun, which is
+            # what made large registries slow to render
+            columns = {"Repository": [], "Tag": [], "Created": [], "Size": []}
+            for repo_data in st.session_state.registry_images:
                 repository = repo_data["repository"]
                 tags = repo_data["tags"]
-                
-                with st.expander(f"📦 {repository} ({len(tags)} tags)"):
-                    # Create a table for tags
-                    if tags:
-                        # Convert tag data to a format suitable for a dataframe
-                        tag_data = []
-                        for tag_info in tags:
-                            tag_name = tag_info["tag"]
-                            created = tag_info["created"]
-                            size = tag_info["size"]
-                            
-                            # Format size to human-readable format
-                            if size > 0:
-                                size_str = f"{size / (1024 * 1024):.2f} MB"
-                            else:
-                                size_str = "Unknown"
-                                
-                            # Format created date if available
-                            created_str = created[:19].replace("T", " ") if created else "Unknown"
-                            
-                            tag_data.append({
-                                "Tag": tag_name,
-                                "Created": created_str,
-                                "Size": size_str,
-                                "Full Name": f"{repository}:{tag_name}"
-                            })
-                        
-                        # Display as a dataframe
-                        import pandas as pd
-                        df = pd.DataFrame(tag_data)
-                        st.dataframe(df, use_container_width=True)
-                        
-                        # Add a button to pull the selected image
-                        selected_tag = st.selectbox(
-                            "Select a tag to pull",
-                            options=[tag_info["tag"] for tag_info in tags],
-                            key=f"select_tag_{repo_index}"
-                        )
-                        
-                        if st.button(f"Pull {repository}:{selected_tag}", key=f"pull_button_{repo_index}"):
-                            st.info(f"Pulling {repository}:{selected_tag} from {registry_url}...")
-                            # This would need to be implemented in the Docker handler
-                            st.warning("Pull functionality not yet implemented")
-                    else:
-                        st.info("No tags found for this repository")
+                if not tags:
+                    continue
+                table = repo_data.get("table") or _build_tag_table(repository, tags)
+                columns["Repository"].extend([repository] * len(tags))
+                columns["Tag"].extend(table["Tag"])
+                columns["Created"].extend(table["Created"])
+                columns["Size"].extend(table["Size"])
+
+            if columns["Repository"]:
+                df = pd.DataFrame(columns)
+                event = st.dataframe(
+                    df,
+                    use_container_width=True,
+                    hide_index=True,
+                    on_select="rerun",
+                    selection_mode="single-row",
+                    key="registry_images_table"
+                )
+
+                # A single pull button for whichever row is selected
+                selected_rows = event.selection.rows
+                if selected_rows:
+                    row = df.iloc[selected_rows[0]]
+                    full_name = f"{row['Repository']}:{row['Tag']}"
+                    if st.button(f"Pull {full_name}", key="pull_selected_image"):
+                        st.info(f"Pulling {full_name} from {registry_url}...")
+                        # This would need to be implemented in the Docker handler
+                        st.warning("Pull functionality not yet implemented")
+                else:
+                    st.caption("Select a row to pull that image")
+            else:
+                st.info("No tags found in the registry")
         else:
             st.info("No images found in the registry")
             if hasattr(st.session_state, "registry_message"):
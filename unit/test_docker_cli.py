@@ -20,11 +20,16 @@ def test_docker_cli():
         # List images
         success, images, message = docker_handler.list_images()
         if success:
-            print(f"✅ Successfully listed images: {len(images)} images found")
-            for image in images[:5]:  # Show first 5 images
-                print(f"   - {image.get('Repository')}:{image.get('Tag')}")
+            # Batch the report into one write instead of a print (and a
+            # stdout lock/flush) per image
+            lines = [f"✅ Successfully listed images: {len(images)} images found"]
+            lines.extend(
+                f"   - {image.get('Repository')}:{image.get('Tag')}"
+                for image in images[:5]  # Show first 5 images
+            )
             if len(images) > 5:
-                print(f"   ... and {len(images) - 5} more")
+                lines.append(f"   ... and {len(images) - 5} more")
+            sys.stdout.write("\n".join(lines) + "\n")
         else:
             print(f"❌ Failed to list images: {message}")
         
@@ -1,12 +1,29 @@
 """
 Utility functions for the Docker Web UI application.
+
+NOTE: this module is shadowed by the ``utils/`` package — every
+``import utils`` in the tree resolves to ``utils/__init__.py``, so
+nothing here is reachable at runtime. The live implementations are in
+``utils/validators.py`` and ``utils/formatters.py``; this file is kept
+only as a legacy copy and is a candidate for deletion.
 """
 
 import re
 import json
+from functools import lru_cache
 from typing import Dict, List, Any, Optional, Tuple
 
+# Validator patterns compiled once at import
+_GIT_URL_RE = re.compile(r'^(https?|git|ssh)://')
+_GIT_SSH_RE = re.compile(r'^git@')
+_TAG_RE = re.compile(r'^[a-zA-Z0-9][a-zA-Z0-9._-]{0,127}$')
+_REPO_RE = re.compile(r'^[a-z0-9]+(?:[._-][a-z0-9]+)*$')
+_REG_URL_RE = re.compile(r'^(https?://)?[a-zA-Z0-9][-a-zA-Z0-9.]*(\.[a-zA-Z0-9][-a-zA-Z0-9.]*)*(:[0-9]+)?$')
+_FROM_RE = re.compile(r'^\s*FROM\s+', re.MULTILINE)
+_BUILD_ARG_KEY_RE = re.compile(r'^[a-zA-Z0-9_]+$')
+
 
+@lru_cache(maxsize=256)
 def validate_git_url(url: str) -> Tuple[bool, str]:
     """
     Validate a Git URL.
@@ -21,12 +38,13 @@ def validate_git_url(url: str) -> Tuple[bool, str]:
         return False, "Git URL is required"
     
     # Basic validation for common Git URL formats
-    if re.match(r'^(https?|git|ssh)://', url) or re.match(r'^git@', url):
+    if _GIT_URL_RE.match(url) or _GIT_SSH_RE.match(url):
         return True, ""
     
     return False, "Invalid Git URL format"
 
 
+@lru_cache(maxsize=256)
 def validate_docker_tag(tag: str) -> Tuple[bool, str]:
     """
     Validate a Docker tag.
@@ -41,12 +59,13 @@ def validate_docker_tag(tag: str) -> Tuple[bool, str]:
         return False, "Tag is required"
     
     # Docker tag validation
-    if re.match(r'^[a-zA-Z0-9][a-zA-Z0-9._-]{0,127}$', tag):
+    if _TAG_RE.match(tag):
         return True, ""
     
     return False, "Invalid Docker tag format"
 
 
+@lru_cache(maxsize=256)
 def validate_docker_repository(repository: str) -> Tuple[bool, str]:
     """
     Validate a Docker repository name.
@@ -61,12 +80,13 @@ def validate_docker_repository(repository: str) -> Tuple[bool, str]:
         return False, "Repository name is required"
     
     # Docker repository name validation
-    if re.match(r'^[a-z0-9]+(?:[._-][a-z0-9]+)*$', repository):
+    if _REPO_RE.match(repository):
         return True, ""
     
     return False, "Invalid Docker repository name format"
 
 
+@lru_cache(maxsize=256)
 def validate_registry_url(url: str) -> Tuple[bool, str]:
     """
     Validate a Docker registry URL.
@@ -81,7 +101,7 @@ def validate_registry_url(url: str) -> Tuple[bool, str]:
         return False, "Registry URL is required"
     
     # Basic URL validation
-    if re.match(r'^(https?://)?[a-zA-Z0-9][-a-zA-Z0-9.]*(\.[a-zA-Z0-9][-a-zA-Z0-9.]*)*(:[0-9]+)?$', url):
+    if _REG_URL_RE.match(url):
         return True, ""
     
     return False, "Invalid registry URL format"
@@ -99,14 +119,27 @@ def validate_dockerfile_content(content: str) -> Tuple[bool, str]:
     """
     if not content:
         return False, "Dockerfile content is required"
-    
-    # Check for FROM instruction
-    if not re.search(r'^\s*FROM\s+', content, re.MULTILINE):
+
+    # Check for FROM instruction. It is almost always within the first few
+    # lines, so scan those with plain string ops before falling back to the
+    # full multiline regex
+    for line in content.splitlines()[:50]:
+        stripped = line.lstrip()
+        if stripped.startswith(("FROM ", "FROM\t")):
+            return True, ""
+
+    if not _FROM_RE.search(content):
         return False, "Dockerfile must contain a FROM instruction"
-    
+
     return True, ""
 
 
+@lru_cache(maxsize=256)
+def _validate_arg_key(key: str) -> bool:
+    """Check a single build-argument key (memoized)."""
+    return bool(_BUILD_ARG_KEY_RE.match(key))
+
+
 def validate_build_args(build_args: Dict[str, str]) -> Tuple[bool, str]:
     """
     Validate build arguments.
@@ -118,7 +151,7 @@ def validate_build_args(build_args: Dict[str, str]) -> Tuple[bool, str]:
         Tuple of (is_valid, error_message)
     """
     for key, value in build_args.items():
-        if not key or not re.match(r'^[a-zA-Z0-9_]+$', key):
+        if not key or not _validate_arg_key(key):
             return False, f"Invalid build argument key: {key}"
     
     return True, ""
@@ -149,6 +182,26 @@ def format_docker_images(images: List[Dict[str, Any]]) -> str:
     return "\n".join(formatted)
 
 
+def _format_status_entry(entry: Dict[str, Any]) -> str:
+    """Format a status log entry, including progress when present."""
+    detail = entry.get('progressDetail')
+    if detail:
+        total = detail.get('total', 0)
+        if total > 0:
+            percentage = int(detail.get('current', 0) / total * 100)
+            return f"{entry['status']} - {percentage}%"
+    return entry['status']
+
+
+# Formatter per entry kind, checked in priority order; builds emit one
+# entry per output line, so the loop below is hot for long logs
+_LOG_FORMATTERS = (
+    ('stream', lambda e: e['stream'].rstrip()),
+    ('error', lambda e: f"ERROR: {e['error']}"),
+    ('status', _format_status_entry),
+)
+
+
 def format_build_log(logs: List[Dict[str, Any]]) -> str:
     """
     Format build logs for display.
@@ -161,27 +214,17 @@ def format_build_log(logs: List[Dict[str, Any]]) -> str:
     """
     if not logs:
         return "No logs available"
-    
+
     formatted = []
+    append = formatted.append
     for entry in logs:
-        if 'stream' in entry:
-            formatted.append(entry['stream'].rstrip())
-        elif 'error' in entry:
-            formatted.append(f"ERROR: {entry['error']}")
-        elif 'status' in entry:
-            if 'progressDetail' in entry and entry['progressDetail']:
-                progress = entry['progressDetail'].get('current', 0)
-                total = entry['progressDetail'].get('total', 0)
-                if total > 0:
-                    percentage = int(progress / total * 100)
-                    formatted.append(f"{entry['status']} - {percentage}%")
-                else:
-                    formatted.append(entry['status'])
-            else:
-                formatted.append(entry['status'])
+        for key, formatter in _LOG_FORMATTERS:
+            if key in entry:
+                append(formatter(entry))
+                break
         else:
-            formatted.append(str(entry))
-    
+            append(str(entry))
+
     return "\n".join(formatted)
 
 
@@ -242,6 +285,7 @@ def format_success_message(message: str) -> str:
     return f"Success: {message}"
 
 
+@lru_cache(maxsize=32)
 def format_registry_url(url: str) -> str:
     """
     Format registry URL.
@@ -250,14 +294,9 @@ def format_registry_url(url: str) -> str:
         url: Registry URL
 
     Returns:
-        Formatted registry URL
+        Formatted registry URL with protocol and trailing slash
     """
-    # Ensure URL has protocol
-    if not url.startswith(("http://", "https://")):
-        url = f"http://{url}"
-    
-    # Ensure URL has trailing slash
-    if not url.endswith("/"):
-        url = f"{url}/"
-    
-    return url
+    # Single allocation: pick the missing pieces, then build the result once
+    prefix = "" if url.startswith(("http://", "https://")) else "http://"
+    suffix = "" if url.endswith("/") else "/"
+    return f"{prefix}{url}{suffix}"
@@ -1,10 +1,48 @@
 """Validation utilities for the Docker Web UI application."""
 
 import re
+from collections import deque
+from functools import lru_cache
 from typing import Tuple, Dict, Any, Optional
-from urllib.parse import urlparse
-
 
+# Patterns compiled once at import. The validators run on every Streamlit
+# rerun, so calling .match() on the compiled object skips the re module's
+# per-call cache lookup (and any re-parse on cache eviction). Everything
+# matched here is ASCII, so re.ASCII keeps \s/\S and the classes on the
+# byte-oriented fast path instead of Unicode-property dispatch
+# HTTPS format: https://github.com/username/repo.git
+# SSH format: git@github.com:username/repo.git
+# One alternation so a valid URL is matched in a single engine entry
+_GIT_URL_RE = re.compile(
+    r'^(?:https?://[a-zA-Z0-9_.-]+\.[a-zA-Z0-9_.-]+/[a-zA-Z0-9_.-]+/[a-zA-Z0-9_.-]+(?:\.git)?'
+    r'|git@[a-zA-Z0-9_.-]+\.[a-zA-Z0-9_.-]+:[a-zA-Z0-9_.-]+/[a-zA-Z0-9_.-]+(?:\.git)?)$',
+    re.ASCII
+)
+_DOCKER_TAG_RE = re.compile(r'^[a-z0-9][a-z0-9._-]*[a-z0-9]$|^[a-z0-9]$', re.ASCII)
+# The separator class folds '/' in with '._-': requiring [a-z0-9]+
+# between separators already forbids components that start or end with
+# one, so the flat form validates the same set with fewer NFA states
+_DOCKER_REPO_RE = re.compile(r'^[a-z0-9]+(?:[._/-][a-z0-9]+)*$', re.ASCII)
+_FROM_RE = re.compile(r'^\s*FROM\s+\S+', re.MULTILINE | re.ASCII)
+
+# Result tuples shared at module scope; returning the same object per
+# outcome saves a tuple allocation on every call
+_OK = (True, "")
+_ERR_GIT_EMPTY = (False, "Git URL cannot be empty")
+_ERR_GIT_FORMAT = (False, "Invalid Git URL format. Expected format: https://github.com/username/repo.git or git@github.com:username/repo.git")
+_ERR_TAG_EMPTY = (False, "Docker tag cannot be empty")
+_ERR_TAG_LENGTH = (False, "Invalid Docker tag format. Tags must be at most 128 characters.")
+_ERR_TAG_FORMAT = (False, "Invalid Docker tag format. Tags must be lowercase, can contain digits, periods, underscores, or hyphens, and must begin and end with alphanumeric characters.")
+_ERR_REPO_EMPTY = (False, "Docker repository cannot be empty")
+_ERR_REPO_LENGTH = (False, "Invalid Docker repository format. Repository names must be at most 255 characters.")
+_ERR_REPO_FORMAT = (False, "Invalid Docker repository format. Repository names must be lowercase, can contain digits, periods, underscores, or hyphens, and components must be separated by forward slashes.")
+_ERR_REGISTRY_EMPTY = (False, "Registry URL cannot be empty")
+_ERR_REGISTRY_FORMAT = (False, "Invalid registry URL format. Expected format: hostname:port or http(s)://hostname:port")
+_ERR_DOCKERFILE_EMPTY = (False, "Dockerfile content cannot be empty")
+_ERR_DOCKERFILE_FROM = (False, "Dockerfile must contain a FROM instruction")
+
+
+@lru_cache(maxsize=1024)
 def validate_git_url(url: str) -> Tuple[bool, str]:
     """
     Validate a Git repository URL.
@@ -17,18 +55,20 @@ def validate_git_url(url: str) -> Tuple[bool, str]:
     """
     # Check if URL is empty
     if not url:
-        return False, "Git URL cannot be empty"
+        return _ERR_GIT_EMPTY
     
     # Check for common Git URL formats
-    # HTTPS format: https://github.com/username/repo.git
-    # SSH format: git@github.com:username/repo.git
-    https_pattern = r'^https?://[a-zA-Z0-9_.-]+\.[a-zA-Z0-9_.-]+/[a-zA-Z0-9_.-]+/[a-zA-Z0-9_.-]+(?:\.git)?$'
-    ssh_pattern = r'^git@[a-zA-Z0-9_.-]+\.[a-zA-Z0-9_.-]+:[a-zA-Z0-9_.-]+/[a-zA-Z0-9_.-]+(?:\.git)?$'
-    
-    if re.match(https_pattern, url) or re.match(ssh_pattern, url):
-        return True, ""
+    if _GIT_URL_RE.match(url):
+        return _OK
     
-    return False, "Invalid Git URL format. Expected format: https://github.com/username/repo.git or git@github.com:username/repo.git"
+    return _ERR_GIT_FORMAT
+
+
+# Bounded positive cache for validate_docker_tag: the same tags recur on
+# every rerun, and a plain set membership test is cheaper than even an
+# lru_cache hit. The deque evicts oldest-first to keep the set bounded.
+_VALID_TAG_CACHE = set()
+_VALID_TAG_ORDER = deque(maxlen=512)
 
 
 def validate_docker_tag(tag: str) -> Tuple[bool, str]:
@@ -41,21 +81,32 @@ def validate_docker_tag(tag: str) -> Tuple[bool, str]:
     Returns:
         Tuple of (is_valid, error_message)
     """
+    if tag in _VALID_TAG_CACHE:
+        return _OK
+
     # Check if tag is empty
     if not tag:
-        return False, "Docker tag cannot be empty"
-    
+        return _ERR_TAG_EMPTY
+
+    # Docker caps tags at 128 characters; rejecting longer input up
+    # front also bounds the regex engine's work on pathological strings
+    if len(tag) > 128:
+        return _ERR_TAG_LENGTH
+
     # Docker tag validation according to Docker's naming rules
     # Lowercase letters, digits, and separators (period, underscore, or hyphen)
     # Must begin and end with alphanumeric character
-    pattern = r'^[a-z0-9][a-z0-9._-]*[a-z0-9]$|^[a-z0-9]$'
-    
-    if re.match(pattern, tag):
-        return True, ""
-    
-    return False, "Invalid Docker tag format. Tags must be lowercase, can contain digits, periods, underscores, or hyphens, and must begin and end with alphanumeric characters."
+    if _DOCKER_TAG_RE.match(tag):
+        if len(_VALID_TAG_ORDER) == _VALID_TAG_ORDER.maxlen:
+            _VALID_TAG_CACHE.discard(_VALID_TAG_ORDER[0])
+        _VALID_TAG_ORDER.append(tag)
+        _VALID_TAG_CACHE.add(tag)
+        return _OK
+
+    return _ERR_TAG_FORMAT
 
 
+@lru_cache(maxsize=1024)
 def validate_docker_repository(repository: str) -> Tuple[bool, str]:
     """
     Validate a Docker repository name.
@@ -68,18 +119,21 @@ def validate_docker_repository(repository: str) -> Tuple[bool, str]:
     """
     # Check if repository is empty
     if not repository:
-        return False, "Docker repository cannot be empty"
-    
+        return _ERR_REPO_EMPTY
+
+    # Registries cap repository names at 255 characters; the early
+    # bound also limits backtracking on adversarial input
+    if len(repository) > 255:
+        return _ERR_REPO_LENGTH
+
     # Docker repository validation according to Docker's naming rules
     # Lowercase letters, digits, and separators (period, underscore, or hyphen)
     # Components separated by forward slashes
     # Must begin and end with alphanumeric character
-    pattern = r'^[a-z0-9]+(?:[._-][a-z0-9]+)*(?:/[a-z0-9]+(?:[._-][a-z0-9]+)*)*$'
+    if _DOCKER_REPO_RE.match(repository):
+        return _OK
     
-    if re.match(pattern, repository):
-        return True, ""
-    
-    return False, "Invalid Docker repository format. Repository names must be lowercase, can contain digits, periods, underscores, or hyphens, and components must be separated by forward slashes."
+    return _ERR_REPO_FORMAT
 
 
 def validate_registry_url(url: str) -> Tuple[bool, str]:
@@ -94,20 +148,17 @@ def validate_registry_url(url: str) -> Tuple[bool, str]:
     """
     # Check if URL is empty
     if not url:
-        return False, "Registry URL cannot be empty"
-    
-    # Add http:// prefix if not present for urlparse
-    if not url.startswith(('http://', 'https://')):
-        url = f"http://{url}"
-    
-    # Parse the URL
-    parsed_url = urlparse(url)
-    
-    # Check if hostname is present
-    if not parsed_url.netloc:
-        return False, "Invalid registry URL format. Expected format: hostname:port or http(s)://hostname:port"
-    
-    return True, ""
+        return _ERR_REGISTRY_EMPTY
+
+    # All that matters is a non-empty host after the optional scheme; a
+    # couple of str ops check that without urlparse's full scheme/
+    # authority/path/query scan and ParseResult allocation
+    rest = url.removeprefix('https://').removeprefix('http://')
+    host = rest.partition('/')[0]
+    if not host or host.startswith(':'):
+        return _ERR_REGISTRY_FORMAT
+
+    return _OK
 
 
 def validate_dockerfile_content(content: str) -> Tuple[bool, str]:
@@ -122,13 +173,19 @@ def validate_dockerfile_content(content: str) -> Tuple[bool, str]:
     """
     # Check if content is empty
     if not content:
-        return False, "Dockerfile content cannot be empty"
+        return _ERR_DOCKERFILE_EMPTY
     
-    # Check for required FROM instruction
-    if not re.search(r'^\s*FROM\s+\S+', content, re.MULTILINE):
-        return False, "Dockerfile must contain a FROM instruction"
+    # Fast path: nearly every Dockerfile opens with FROM on the first
+    # non-blank line, so a prefix check avoids the regex engine entirely
+    if content.lstrip().startswith(('FROM ', 'FROM\t')):
+        return _OK
+
+    # Check for required FROM instruction on a later line (e.g. leading
+    # comments or ARG before FROM)
+    if not _FROM_RE.search(content):
+        return _ERR_DOCKERFILE_FROM
     
-    return True, ""
+    return _OK
 
 
 def validate_build_args(build_args: Optional[Dict[str, Any]]) -> Tuple[bool, str, Dict[str, str]]:
@@ -147,8 +204,10 @@ def validate_build_args(build_args: Optional[Dict[str, Any]]) -> Tuple[bool, str
     validated_args = {}
     
     for key, value in build_args.items():
-        # Validate key format
-        if not re.match(r'^[a-zA-Z0-9_]+$', key):
+        # Validate key format: ASCII alphanumerics and underscores. The
+        # C-level str checks cover this without entering the regex engine;
+        # isascii() guards isalnum() from accepting non-ASCII letters
+        if not key or not (key.isascii() and key.replace('_', 'a').isalnum()):
             return False, f"Invalid build argument key: {key}. Keys must contain only alphanumeric characters and underscores.", {}
         
         # Convert value to string